@@ -17,12 +17,17 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         type=Path,
         help="Optional path to write the resulting schedule as JSON",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-read the Excel configuration instead of reusing a cached parse",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
-    config = load_config_from_excel(args.config)
+    config = load_config_from_excel(args.config, use_cache=not args.no_cache)
     result = solve(config)
 
     report: Dict[str, Any] = {
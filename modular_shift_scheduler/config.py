@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Iterable, List, Sequence, Set
+from functools import cached_property
+from typing import Dict, Iterable, List, Sequence, Set
 
 
 @dataclass(slots=True)
@@ -36,6 +37,9 @@ class ShiftDemand:
     required_skill: str
     required_employees: int
     weight: float = 1.0
+    # Slot indices on the solver's time grid, filled in by ``solve`` before the search runs.
+    start_slot: int = field(default=-1, init=False, repr=False, compare=False)
+    end_slot: int = field(default=-1, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:  # pragma: no cover - defensive programming
         if self.end <= self.start:
@@ -51,9 +55,13 @@ class ShiftDemand:
         return self.end - self.start
 
 
-@dataclass(slots=True)
+@dataclass
 class SchedulingConfig:
-    """Aggregates employees, shift demands and global solver options."""
+    """Aggregates employees, shift demands and global solver options.
+
+    ``shift_by_id`` is cached on first access, so ``shifts`` must not be reassigned or resized
+    afterwards; mutating the attributes of individual shifts is fine.
+    """
 
     employees: List[Employee] = field(default_factory=list)
     shifts: List[ShiftDemand] = field(default_factory=list)
@@ -79,6 +87,10 @@ class SchedulingConfig:
                 raise ValueError(f"Duplicate {label} identifier: {identifier}")
             seen.add(identifier)
 
+    @cached_property
+    def shift_by_id(self) -> Dict[str, ShiftDemand]:
+        return {shift.identifier: shift for shift in self.shifts}
+
     def all_skills(self) -> Set[str]:
         skills: Set[str] = set()
         for employee in self.employees:
@@ -88,6 +100,16 @@ class SchedulingConfig:
     def required_skills(self) -> Set[str]:
         return {shift.required_skill for shift in self.shifts}
 
+    def skill_bits(self) -> Dict[str, int]:
+        """Intern every skill used by an employee or shift to its own bit.
+
+        The mapping is derived from the current ``skills`` on each call, so masks built from it
+        never go stale when skills change after ``validate``.
+        """
+
+        skills = sorted(self.all_skills() | self.required_skills())
+        return {skill: 1 << skill_id for skill_id, skill in enumerate(skills)}
+
     def employees_with_skill(self, skill: str) -> Iterable[Employee]:
         skill_lower = skill.strip().lower()
         return (emp for emp in self.employees if skill_lower in emp.skills)
@@ -7,19 +7,47 @@ from .config import Employee, SchedulingConfig, ShiftDemand
 from .time_index import TimeIndexer
 
 AssignmentsByEmployee = Dict[str, List[str]]
-def assignment_candidates(config: SchedulingConfig) -> Dict[str, List[str]]:
+def assignment_candidates(
+    config: SchedulingConfig, indexer: TimeIndexer | None = None
+) -> Dict[str, List[str]]:
+    """Return the employees eligible for each shift.
+
+    Eligibility requires the shift's skill. When ``indexer`` is given, employees whose weekly cap
+    is shorter than the shift itself are pruned as well, since they can never work it. Candidates
+    are ordered by ascending hourly cost (ties broken by identifier).
+    """
+
+    # Skills are interned to bits for this call only, so each eligibility test is a single AND of
+    # the shift's bit against the employee's mask; iterating in cost order keeps results sorted.
+    skill_bits = config.skill_bits()
+    ranked: List[Tuple[Employee, int]] = []
+    for employee in sorted(config.employees, key=lambda emp: (emp.cost_per_hour, emp.identifier)):
+        mask = 0
+        for skill in employee.skills:
+            mask |= skill_bits[skill]
+        ranked.append((employee, mask))
+
     candidates: Dict[str, List[str]] = {}
     for shift in config.shifts:
+        required_bit = skill_bits[shift.required_skill]
+        skilled = [employee for employee, mask in ranked if mask & required_bit]
+        if indexer is None:
+            candidates[shift.identifier] = [employee.identifier for employee in skilled]
+            continue
+        duration = indexer.duration_for_shift(shift)
         candidates[shift.identifier] = [
             employee.identifier
-            for employee in config.employees
-            if shift.required_skill in employee.skills
+            for employee in skilled
+            if duration <= employee.max_hours_per_week + 1e-6
         ]
     return candidates
 
 
 def shortage_for_shift(shift: ShiftDemand, assigned_employees: Iterable[str]) -> int:
-    assigned_count = len(list(assigned_employees))
+    try:
+        assigned_count = len(assigned_employees)  # type: ignore[arg-type]
+    except TypeError:
+        assigned_count = sum(1 for _ in assigned_employees)
     return max(0, shift.required_employees - assigned_count)
 
 
@@ -27,15 +55,15 @@ def hours_used_by_employee(
     assignments: AssignmentsByEmployee,
     config: SchedulingConfig,
     indexer: TimeIndexer,
+    shift_hours: Mapping[str, float] | None = None,
 ) -> Dict[str, float]:
-    shift_lookup = {shift.identifier: shift for shift in config.shifts}
+    if shift_hours is None:
+        shift_hours = {
+            shift.identifier: indexer.duration_for_shift(shift) for shift in config.shifts
+        }
     hours: Dict[str, float] = {employee.identifier: 0.0 for employee in config.employees}
     for employee_id, shift_ids in assignments.items():
-        total = 0.0
-        for shift_id in shift_ids:
-            shift = shift_lookup[shift_id]
-            total += indexer.duration_for_shift(shift)
-        hours[employee_id] = total
+        hours[employee_id] = sum(shift_hours[shift_id] for shift_id in shift_ids)
     return hours
 
 
@@ -43,8 +71,9 @@ def max_hours_respected(
     assignments: AssignmentsByEmployee,
     config: SchedulingConfig,
     indexer: TimeIndexer,
+    shift_hours: Mapping[str, float] | None = None,
 ) -> bool:
-    hours = hours_used_by_employee(assignments, config, indexer)
+    hours = hours_used_by_employee(assignments, config, indexer, shift_hours)
     for employee in config.employees:
         if hours[employee.identifier] - 1e-6 > employee.max_hours_per_week:
             return False
@@ -56,20 +85,22 @@ def overlapping_shifts_for_employee(
     assignments: AssignmentsByEmployee,
     shift_lookup: Mapping[str, ShiftDemand],
 ) -> List[Tuple[str, str]]:
+    # Sweep the shifts in start order, keeping only those still running when the next one
+    # starts. Without overlaps the active list holds a single shift, so the cost is dominated by
+    # the sort rather than a pairwise comparison of every assignment.
     overlaps: List[Tuple[str, str]] = []
-    shift_ids = assignments.get(employee_id, [])
-    for i, shift_id in enumerate(shift_ids):
-        for other_shift_id in shift_ids[i + 1 :]:
-            shift_a = shift_lookup[shift_id]
-            shift_b = shift_lookup[other_shift_id]
-            if shift_a.start < shift_b.end and shift_b.start < shift_a.end:
-                overlaps.append((shift_id, other_shift_id))
+    active: List[str] = []
+    shift_ids = sorted(assignments.get(employee_id, []), key=lambda sid: shift_lookup[sid].start)
+    for shift_id in shift_ids:
+        start = shift_lookup[shift_id].start
+        active = [other for other in active if shift_lookup[other].end > start]
+        overlaps.extend((other, shift_id) for other in active)
+        active.append(shift_id)
     return overlaps
 
 
 def no_overlaps(assignments: AssignmentsByEmployee, config: SchedulingConfig) -> bool:
-    shift_lookup = {shift.identifier: shift for shift in config.shifts}
     for employee in config.employees:
-        if overlapping_shifts_for_employee(employee.identifier, assignments, shift_lookup):
+        if overlapping_shifts_for_employee(employee.identifier, assignments, config.shift_by_id):
             return False
     return True
@@ -1,45 +1,73 @@
 """Utilities for loading scheduling configuration from Excel workbooks."""
 from __future__ import annotations
 
-import re
+import copy
 import zipfile
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence
 from xml.etree import ElementTree as ET
 
 from .config import Employee, SchedulingConfig, ShiftDemand
 
+try:  # lxml's C parser is considerably faster; ElementTree remains the stdlib fallback.
+    from lxml import etree as _lxml_etree
+except ImportError:  # pragma: no cover - optional dependency
+    _lxml_etree = None
+
 NAMESPACE_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
 NAMESPACE_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
 RELATIONSHIP_ATTR = (
     "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
 )
+_V = f"{NAMESPACE_MAIN}v"
+_INLINE_TEXT = f"{NAMESPACE_MAIN}is/{NAMESPACE_MAIN}t"
 
 
-def _normalize_header(header: Iterable[str]) -> List[str]:
+def _normalize_header(header: Iterable[object]) -> List[str]:
     return [str(cell).strip().lower().replace(" ", "_") for cell in header]
 
 
-def load_config_from_excel(path: Path | str) -> SchedulingConfig:
-    """Load a :class:`SchedulingConfig` from an Excel workbook."""
+def load_config_from_excel(path: Path | str, *, use_cache: bool = True) -> SchedulingConfig:
+    """Load a :class:`SchedulingConfig` from an Excel workbook.
+
+    Parsed workbooks are cached by resolved path, modification time and size, so reloading an
+    unchanged file skips the XML parsing. Every call returns an independent copy that callers
+    may mutate freely. Pass ``use_cache=False`` to always re-read the file.
+    """
+
+    path = Path(path)
+    if not use_cache:
+        return _parse_config(path)
+    stat = path.stat()
+    return copy.deepcopy(_parse_config_cached(path.resolve(), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=32)
+def _parse_config_cached(path: Path, mtime_ns: int, size: int) -> SchedulingConfig:
+    # ``mtime_ns`` and ``size`` only participate in the cache key.
+    return _parse_config(path)
+
 
-    sheets = _read_sheets(Path(path))
+def _parse_config(path: Path) -> SchedulingConfig:
+    sheets = _read_sheets(path)
     try:
         employees_rows = sheets["employees"]
         shifts_rows = sheets["shifts"]
     except KeyError as exc:  # pragma: no cover - defensive
         raise ValueError("Workbook must contain 'Employees' and 'Shifts' sheets") from exc
 
-    employees = _load_employees(tuple(tuple(row) for row in employees_rows))
-    shifts = _load_shifts(tuple(tuple(row) for row in shifts_rows))
+    employees = _load_employees(employees_rows)
+    shifts = _load_shifts(shifts_rows)
 
     config = SchedulingConfig(employees=employees, shifts=shifts)
     config.validate()
     return config
 
 
-def _load_employees(rows: Iterable[tuple[object, ...]]) -> List[Employee]:
+def _load_employees(rows: Iterable[Sequence[object]]) -> List[Employee]:
     iterator = iter(rows)
     header = _normalize_header(next(iterator, ()))
     required_columns = {"id", "name", "skills", "max_hours_per_week"}
@@ -50,8 +78,10 @@ def _load_employees(rows: Iterable[tuple[object, ...]]) -> List[Employee]:
 
     col_index = {label: idx for idx, label in enumerate(header)}
     employees: List[Employee] = []
+    id_idx = col_index["id"]
     for row in iterator:
-        if not any(row):
+        # Blank-row detection keys on the required ``id`` column only.
+        if len(row) <= id_idx or row[id_idx] in (None, ""):
             continue
         identifier = str(row[col_index["id"]]).strip()
         name = str(row[col_index["name"]]).strip()
@@ -85,7 +115,7 @@ def _parse_datetime(value: object) -> datetime:
     raise TypeError(f"Unsupported datetime value: {value!r}")
 
 
-def _load_shifts(rows: Iterable[tuple[object, ...]]) -> List[ShiftDemand]:
+def _load_shifts(rows: Iterable[Sequence[object]]) -> List[ShiftDemand]:
     iterator = iter(rows)
     header = _normalize_header(next(iterator, ()))
     required_columns = {"id", "start", "end", "required_skill", "required_employees"}
@@ -96,8 +126,10 @@ def _load_shifts(rows: Iterable[tuple[object, ...]]) -> List[ShiftDemand]:
 
     col_index = {label: idx for idx, label in enumerate(header)}
     shifts: List[ShiftDemand] = []
+    id_idx = col_index["id"]
     for row in iterator:
-        if not any(row):
+        # Blank-row detection keys on the required ``id`` column only.
+        if len(row) <= id_idx or row[id_idx] in (None, ""):
             continue
         identifier = str(row[col_index["id"]]).strip()
         start = _parse_datetime(row[col_index["start"]])
@@ -123,7 +155,7 @@ def _load_shifts(rows: Iterable[tuple[object, ...]]) -> List[ShiftDemand]:
     return shifts
 
 
-def _read_sheets(path: Path) -> Dict[str, List[List[object]]]:
+def _read_sheets(path: Path) -> Dict[str, Iterator[List[object]]]:
     with zipfile.ZipFile(path, "r") as archive:
         workbook_xml = archive.read("xl/workbook.xml")
         workbook_root = ET.fromstring(workbook_xml)
@@ -143,7 +175,8 @@ def _read_sheets(path: Path) -> Dict[str, List[List[object]]]:
 
         shared_strings = _read_shared_strings(archive)
 
-        parsed: Dict[str, List[List[object]]] = {}
+        # Sheet bytes are read while the archive is open; rows are decoded lazily afterwards.
+        parsed: Dict[str, Iterator[List[object]]] = {}
         for name, relationship_id in sheets:
             target = relationships.get(relationship_id)
             if target is None:
@@ -161,9 +194,8 @@ def _read_shared_strings(archive: zipfile.ZipFile) -> List[str]:
         data = archive.read("xl/sharedStrings.xml")
     except KeyError:
         return []
-    root = ET.fromstring(data)
     strings = []
-    for si in root.findall(f"{NAMESPACE_MAIN}si"):
+    for si in _iter_closed_elements(data, f"{NAMESPACE_MAIN}si"):
         text_elem = si.find(f"{NAMESPACE_MAIN}t")
         if text_elem is None:
             # Some strings may contain rich text runs; concatenate their text nodes.
@@ -177,26 +209,65 @@ def _read_shared_strings(archive: zipfile.ZipFile) -> List[str]:
     return strings
 
 
-_COLUMN_REF_RE = re.compile(r"([A-Z]+)")
+def _iter_closed_elements(data: bytes, tag: str) -> Iterator[ET.Element]:
+    """Yield every ``tag`` element of ``data`` once it has been fully parsed.
+
+    Each element is cleared and detached from its parent once the caller resumes, so earlier
+    elements never accumulate and memory stays flat however long the document is.
+    """
+
+    if _lxml_etree is not None:
+        for _, elem in _lxml_etree.iterparse(BytesIO(data), events=("end",), tag=tag):
+            yield elem
+            elem.clear()
+            # Cleared elements stay attached to the parent until removed.
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return
+    # ElementTree has no parent links, so open elements are tracked to find each one's parent.
+    open_elements: List[ET.Element] = []
+    for event, elem in ET.iterparse(BytesIO(data), events=("start", "end")):
+        if event == "start":
+            open_elements.append(elem)
+            continue
+        open_elements.pop()
+        if elem.tag == tag:
+            yield elem
+            elem.clear()
+            if open_elements:
+                open_elements[-1].remove(elem)
 
 
-def _column_index(cell_reference: str) -> int:
-    match = _COLUMN_REF_RE.match(cell_reference)
-    if not match:
-        raise ValueError(f"Invalid cell reference: {cell_reference}")
-    letters = match.group(1)
-    index = 0
-    for char in letters:
-        index = index * 26 + (ord(char) - ord("A") + 1)
-    return index - 1
+# Column letters repeat on every row, so each distinct prefix is decoded only once.
+_COLUMN_INDEX_CACHE: Dict[str, int] = {}
 
 
-def _parse_sheet(data: bytes, shared_strings: List[str]) -> List[List[object]]:
-    root = ET.fromstring(data)
-    rows: List[List[object]] = []
-    for row_elem in root.findall(f"{NAMESPACE_MAIN}sheetData/{NAMESPACE_MAIN}row"):
+def _column_index(cell_reference: str) -> int:
+    end = 0
+    while end < len(cell_reference) and "A" <= cell_reference[end] <= "Z":
+        end += 1
+    if not end:
+        raise ValueError(f"Invalid cell reference: {cell_reference}")
+    letters = cell_reference[:end]
+    index = _COLUMN_INDEX_CACHE.get(letters)
+    if index is None:
+        index = 0
+        for char in letters:
+            index = index * 26 + (ord(char) - ord("A") + 1)
+        index -= 1
+        _COLUMN_INDEX_CACHE[letters] = index
+    return index
+
+
+def _parse_sheet(data: bytes, shared_strings: List[str]) -> Iterator[List[object]]:
+    # Stream the sheet: each <row> is yielded as soon as it is closed and then discarded, so
+    # neither the elements nor the decoded rows of the whole sheet are held at once.
+    cell_tag = f"{NAMESPACE_MAIN}c"
+    for row_elem in _iter_closed_elements(data, f"{NAMESPACE_MAIN}row"):
         values: Dict[int, object] = {}
-        for cell in row_elem.findall(f"{NAMESPACE_MAIN}c"):
+        for cell in row_elem:
+            if cell.tag != cell_tag:
+                continue
             reference = cell.attrib.get("r")
             if reference is None:
                 continue
@@ -208,28 +279,45 @@ def _parse_sheet(data: bytes, shared_strings: List[str]) -> List[List[object]]:
         max_index = max(values) if values else -1
         for idx in range(max_index + 1):
             row_values.append(values.get(idx))
-        rows.append(row_values)
-    return rows
+        yield row_values
 
 
 def _parse_cell(
     cell: ET.Element, cell_type: str | None, shared_strings: List[str]
 ) -> object | None:
-    if cell_type == "s":
-        index_elem = cell.find(f"{NAMESPACE_MAIN}v")
-        if index_elem is None or index_elem.text is None:
-            return None
-        return shared_strings[int(index_elem.text)]
-    if cell_type == "inlineStr":
-        text_elem = cell.find(f"{NAMESPACE_MAIN}is/{NAMESPACE_MAIN}t")
-        return text_elem.text if text_elem is not None else ""
-    value_elem = cell.find(f"{NAMESPACE_MAIN}v")
+    return _CELL_DISPATCH.get(cell_type, _parse_value_cell)(cell, shared_strings)
+
+
+def _parse_shared_string_cell(cell: ET.Element, shared_strings: List[str]) -> object | None:
+    index_elem = cell.find(_V)
+    if index_elem is None or index_elem.text is None:
+        return None
+    return shared_strings[int(index_elem.text)]
+
+
+def _parse_inline_string_cell(cell: ET.Element, shared_strings: List[str]) -> object | None:
+    text_elem = cell.find(_INLINE_TEXT)
+    return text_elem.text if text_elem is not None else ""
+
+
+def _parse_value_cell(cell: ET.Element, shared_strings: List[str]) -> object | None:
+    value_elem = cell.find(_V)
     if value_elem is None or value_elem.text is None:
         return None
     raw_value = value_elem.text
-    if raw_value.isdigit():
+    if raw_value.isdigit() or (raw_value[:1] == "-" and raw_value[1:].isdigit()):
         return int(raw_value)
     try:
         return float(raw_value)
     except ValueError:
         return raw_value
+
+
+# Handlers keyed by the cell's ``t`` attribute; unknown types are parsed like plain values.
+_CELL_DISPATCH: Dict[str | None, Callable[[ET.Element, List[str]], object | None]] = {
+    "s": _parse_shared_string_cell,
+    "inlineStr": _parse_inline_string_cell,
+    None: _parse_value_cell,
+    "n": _parse_value_cell,
+    "str": _parse_value_cell,
+}
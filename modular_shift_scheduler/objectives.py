@@ -12,21 +12,23 @@ def labour_cost(
     assignments: AssignmentsByEmployee,
     config: SchedulingConfig,
     indexer: TimeIndexer,
+    shift_hours: Mapping[str, float] | None = None,
 ) -> float:
-    shift_lookup = {shift.identifier: shift for shift in config.shifts}
+    if shift_hours is None:
+        shift_hours = {
+            shift.identifier: indexer.duration_for_shift(shift) for shift in config.shifts
+        }
     total = 0.0
     for employee in config.employees:
         for shift_id in assignments.get(employee.identifier, []):
-            shift = shift_lookup[shift_id]
-            hours = indexer.duration_for_shift(shift)
-            total += employee.cost_per_hour * hours
+            total += employee.cost_per_hour * shift_hours[shift_id]
     return total
 
 
 def shortage_penalty(
     shortages: Mapping[str, int], config: SchedulingConfig
 ) -> float:
-    shift_lookup = {shift.identifier: shift for shift in config.shifts}
+    shift_lookup = config.shift_by_id
     penalty = 0.0
     for shift_id, shortage in shortages.items():
         if shortage <= 0:
@@ -40,5 +42,8 @@ def total_objective(
     shortages: Mapping[str, int],
     config: SchedulingConfig,
     indexer: TimeIndexer,
+    shift_hours: Mapping[str, float] | None = None,
 ) -> float:
-    return labour_cost(assignments, config, indexer) + shortage_penalty(shortages, config)
+    return labour_cost(assignments, config, indexer, shift_hours) + shortage_penalty(
+        shortages, config
+    )
@@ -1,15 +1,13 @@
 """High level solver orchestration for the modular shift scheduler."""
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from itertools import combinations
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
 
 from .config import SchedulingConfig
-from .constraints import (
-    AssignmentsByEmployee,
-    assignment_candidates,
-)
+from .constraints import assignment_candidates
 from .objectives import total_objective
 from .time_index import TimeIndexer
 
@@ -33,80 +31,274 @@ class SolverError(RuntimeError):
     """Raised when the search fails to find a feasible solution."""
 
 
-def solve(config: SchedulingConfig) -> SolveResult:
+# CP-SAT only accepts integer coefficients, so objective terms are scaled before rounding.
+_OBJECTIVE_SCALE = 1000
+
+
+def solve(config: SchedulingConfig, *, method: str = "auto") -> SolveResult:
+    """Find the cheapest assignment of employees to shifts.
+
+    ``method`` selects the engine: ``"cp_sat"`` builds an OR-Tools CP-SAT model, ``"search"``
+    runs the pure Python branch-and-bound search and ``"auto"`` prefers CP-SAT whenever OR-Tools
+    is installed.
+    """
+
     config.validate()
     indexer = TimeIndexer.from_shifts(config.shifts, slot_minutes=config.slot_minutes)
-    candidates = assignment_candidates(config)
+    for shift in config.shifts:
+        shift.start_slot, shift.end_slot = indexer.slots_between(shift.start, shift.end)
+    candidates = assignment_candidates(config, indexer)
+    shift_hours = {shift.identifier: indexer.duration_for_shift(shift) for shift in config.shifts}
+
+    if method == "auto":
+        method = "cp_sat" if _load_cp_model() is not None else "search"
+    if method == "cp_sat":
+        cp_model = _load_cp_model()
+        if cp_model is None:
+            raise SolverError("The cp_sat method requires the 'ortools' package")
+        return _solve_cp_sat(config, indexer, candidates, shift_hours, cp_model)
+    if method == "search":
+        return _solve_search(config, candidates, shift_hours)
+    raise ValueError(f"Unknown solve method: {method}")
+
+
+def _load_cp_model() -> Any | None:
+    try:
+        from ortools.sat.python import cp_model
+    except ImportError:
+        return None
+    return cp_model
+
+
+def _solve_cp_sat(
+    config: SchedulingConfig,
+    indexer: TimeIndexer,
+    candidates: Dict[str, List[str]],
+    shift_hours: Dict[str, float],
+    cp_model: Any,
+) -> SolveResult:
     employees = {employee.identifier: employee for employee in config.employees}
-    shifts = sorted(config.shifts, key=lambda shift: (shift.start, shift.identifier))
+    shifts = sorted(config.shifts, key=lambda shift: (shift.start_slot, shift.identifier))
+    model = cp_model.CpModel()
 
-    assignments_by_employee: AssignmentsByEmployee = {
-        employee.identifier: [] for employee in config.employees
+    assign_vars: Dict[Tuple[str, str], Any] = {}
+    shortage_vars: Dict[str, Any] = {}
+    intervals_by_employee: Dict[str, List[Any]] = {employee_id: [] for employee_id in employees}
+    load_by_employee: Dict[str, List[Any]] = {employee_id: [] for employee_id in employees}
+    objective_terms: List[Any] = []
+
+    for shift in shifts:
+        start_slot = shift.start_slot
+        duration_slots = shift.end_slot - start_slot
+        hours = shift_hours[shift.identifier]
+        shift_vars = []
+        for employee_id in candidates[shift.identifier]:
+            var = model.NewBoolVar(f"x_{employee_id}_{shift.identifier}")
+            assign_vars[(employee_id, shift.identifier)] = var
+            shift_vars.append(var)
+            intervals_by_employee[employee_id].append(
+                model.NewOptionalFixedSizeIntervalVar(
+                    start_slot, duration_slots, var, f"interval_{employee_id}_{shift.identifier}"
+                )
+            )
+            load_by_employee[employee_id].append(duration_slots * var)
+            cost = round(employees[employee_id].cost_per_hour * hours * _OBJECTIVE_SCALE)
+            objective_terms.append(cost * var)
+
+        shortage = model.NewIntVar(0, shift.required_employees, f"shortage_{shift.identifier}")
+        shortage_vars[shift.identifier] = shortage
+        model.Add(sum(shift_vars) + shortage == shift.required_employees)
+        penalty = round(shift.weight * config.shortage_penalty_per_employee * _OBJECTIVE_SCALE)
+        objective_terms.append(penalty * shortage)
+
+    for employee_id, employee in employees.items():
+        if not intervals_by_employee[employee_id]:
+            continue
+        model.AddNoOverlap(intervals_by_employee[employee_id])
+        max_slots = math.floor((employee.max_hours_per_week + 1e-6) * 60 / config.slot_minutes)
+        model.Add(sum(load_by_employee[employee_id]) <= max_slots)
+
+    model.Minimize(sum(objective_terms))
+    solver = cp_model.CpSolver()
+    status = solver.Solve(model)
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        raise SolverError(f"No feasible assignment found ({solver.StatusName(status)})")
+
+    assignments: Dict[str, List[str]] = {employee_id: [] for employee_id in employees}
+    for shift in shifts:
+        for employee_id in candidates[shift.identifier]:
+            if solver.BooleanValue(assign_vars[(employee_id, shift.identifier)]):
+                assignments[employee_id].append(shift.identifier)
+    shortages = {
+        shift_id: int(solver.Value(shortage)) for shift_id, shortage in shortage_vars.items()
     }
-    shortages: Dict[str, int] = {shift.identifier: 0 for shift in config.shifts}
 
-    best_assignments: Dict[str, List[str]] | None = None
-    best_shortages: Dict[str, int] | None = None
-    best_objective = float("inf")
+    return SolveResult(
+        status="Optimal" if status == cp_model.OPTIMAL else "Feasible",
+        objective_value=total_objective(assignments, shortages, config, indexer, shift_hours),
+        assignments=assignments,
+        shortage_by_shift=shortages,
+    )
 
-    def is_feasible(employee_id: str, shift_index: int) -> bool:
-        shift = shifts[shift_index]
-        # Check overlap
-        for other_shift_id in assignments_by_employee[employee_id]:
-            other_shift = shift_lookup[other_shift_id]
-            if shift.start < other_shift.end and other_shift.start < shift.end:
-                return False
-        # Check max hours
-        duration = indexer.duration_for_shift(shift)
-        current_hours = sum(
-            indexer.duration_for_shift(shift_lookup[assigned_shift])
-            for assigned_shift in assignments_by_employee[employee_id]
+
+@dataclass(slots=True)
+class _PreparedProblem:
+    """Index-based view of a configuration consumed by the branch-and-bound search.
+
+    Employees and start-sorted shifts are numbered once and their data is held in parallel
+    lists, so the search works on integer indices and never hashes identifiers.
+    """
+
+    employee_ids: List[str]
+    employee_costs: List[float]
+    employee_hour_limits: List[float]
+    shift_ids: List[str]
+    shift_hours: List[float]
+    shift_required: List[int]
+    shift_penalties: List[float]
+    # candidates[i] lists the eligible employee indices for shift i, cheapest first.
+    candidates: List[List[int]]
+    # overlap_masks[i] has bit j set when shifts i and j overlap in time.
+    overlap_masks: List[int]
+    # suffix_bounds[i] is an admissible lower bound on the objective of shifts[i:].
+    suffix_bounds: List[float]
+
+    @classmethod
+    def build(
+        cls,
+        config: SchedulingConfig,
+        candidates: Dict[str, List[str]],
+        shift_hours: Dict[str, float],
+    ) -> "_PreparedProblem":
+        employee_index = {
+            employee.identifier: index for index, employee in enumerate(config.employees)
+        }
+        shifts = sorted(config.shifts, key=lambda shift: (shift.start_slot, shift.identifier))
+        problem = cls(
+            employee_ids=[employee.identifier for employee in config.employees],
+            employee_costs=[employee.cost_per_hour for employee in config.employees],
+            employee_hour_limits=[
+                employee.max_hours_per_week + 1e-6 for employee in config.employees
+            ],
+            shift_ids=[shift.identifier for shift in shifts],
+            shift_hours=[shift_hours[shift.identifier] for shift in shifts],
+            shift_required=[shift.required_employees for shift in shifts],
+            shift_penalties=[
+                shift.weight * config.shortage_penalty_per_employee for shift in shifts
+            ],
+            candidates=[
+                [employee_index[employee_id] for employee_id in candidates[shift.identifier]]
+                for shift in shifts
+            ],
+            overlap_masks=[0] * len(shifts),
+            suffix_bounds=[0.0] * (len(shifts) + 1),
         )
-        return current_hours + duration <= employees[employee_id].max_hours_per_week + 1e-6
-
-    shift_lookup = {shift.identifier: shift for shift in config.shifts}
-
-    def search(shift_index: int) -> None:
-        nonlocal best_assignments, best_objective, best_shortages
-        if shift_index == len(shifts):
-            objective = total_objective(assignments_by_employee, shortages, config, indexer)
-            if objective < best_objective:
-                best_objective = objective
-                best_assignments = {
-                    employee_id: list(shift_ids)
-                    for employee_id, shift_ids in assignments_by_employee.items()
-                }
-                best_shortages = dict(shortages)
+
+        # The pairwise scan is paid once; afterwards an overlap test is a single integer AND.
+        for i, shift_a in enumerate(shifts):
+            end_slot = shift_a.end_slot
+            for j in range(i + 1, len(shifts)):
+                if shifts[j].start_slot >= end_slot:
+                    break  # shifts are sorted by start, so no later shift can overlap shift_a
+                problem.overlap_masks[i] |= 1 << j
+                problem.overlap_masks[j] |= 1 << i
+
+        # Each shift independently staffs the candidates whose labour cost undercuts the shortage
+        # penalty they would avoid, ignoring overlap and hours limits. Candidates are sorted by
+        # cost, so the first ``required`` of them are the cheapest.
+        for i in range(len(shifts) - 1, -1, -1):
+            required = problem.shift_required[i]
+            penalty = problem.shift_penalties[i]
+            bound = required * penalty
+            hours = problem.shift_hours[i]
+            for employee in problem.candidates[i][:required]:
+                bound += min(0.0, problem.employee_costs[employee] * hours - penalty)
+            problem.suffix_bounds[i] = problem.suffix_bounds[i + 1] + bound
+        return problem
+
+
+def _solve_search(
+    config: SchedulingConfig,
+    candidates: Dict[str, List[str]],
+    shift_hours: Dict[str, float],
+) -> SolveResult:
+    problem = _PreparedProblem.build(config, candidates, shift_hours)
+    num_shifts = len(problem.shift_ids)
+    costs = problem.employee_costs
+    hour_limits = problem.employee_hour_limits
+    suffix_bounds = problem.suffix_bounds
+
+    # Incremental per-employee state: hours worked so far and a bitmask of assigned shifts.
+    employee_hours = [0.0] * len(problem.employee_ids)
+    assigned_masks = [0] * len(problem.employee_ids)
+    # chosen[i] is the combination of employee indices currently staffing shift i.
+    chosen: List[Tuple[int, ...]] = [()] * num_shifts
+
+    best_chosen: List[Tuple[int, ...]] | None = None
+    best_objective = float("inf")
+
+    def search(shift_index: int, partial_objective: float) -> None:
+        nonlocal best_chosen, best_objective
+        if partial_objective + suffix_bounds[shift_index] >= best_objective:
+            return
+        if shift_index == num_shifts:
+            best_objective = partial_objective
+            best_chosen = list(chosen)
             return
 
-        shift = shifts[shift_index]
-        eligible_employees = candidates[shift.identifier]
-        max_assignable = min(len(eligible_employees), shift.required_employees)
+        overlap_mask = problem.overlap_masks[shift_index]
+        hours = problem.shift_hours[shift_index]
+        required = problem.shift_required[shift_index]
+        shortage_penalty = problem.shift_penalties[shift_index]
+        shift_bit = 1 << shift_index
+        # Every member of a combination works the same shift, so feasibility is independent per
+        # employee; filtering once keeps infeasible employees out of the combinations entirely.
+        # The check is inlined: it is a bitmask AND plus one float comparison per candidate.
+        eligible_employees = [
+            employee
+            for employee in problem.candidates[shift_index]
+            if not assigned_masks[employee] & overlap_mask
+            and employee_hours[employee] + hours <= hour_limits[employee]
+        ]
+        max_assignable = min(len(eligible_employees), required)
         # Explore in descending order of assigned employees to find feasible solutions quickly.
+        # Candidates are cost-sorted, so combinations() yields the cheapest subsets of each size
+        # first and a strong incumbent is found early for the bound to prune against.
         for count in range(max_assignable, -1, -1):
             for combo in combinations(eligible_employees, count):
-                if not all(is_feasible(employee_id, shift_index) for employee_id in combo):
+                # Extend the parent's objective by this shift's contribution only.
+                objective = partial_objective + (required - count) * shortage_penalty
+                for employee in combo:
+                    objective += costs[employee] * hours
+                if objective + suffix_bounds[shift_index + 1] >= best_objective:
                     continue
-                for employee_id in combo:
-                    assignments_by_employee[employee_id].append(shift.identifier)
-                shortages[shift.identifier] = shift.required_employees - count
 
-                partial_objective = total_objective(assignments_by_employee, shortages, config, indexer)
-                if partial_objective < best_objective:
-                    search(shift_index + 1)
+                for employee in combo:
+                    employee_hours[employee] += hours
+                    assigned_masks[employee] |= shift_bit
+                chosen[shift_index] = combo
+                search(shift_index + 1, objective)
+                for employee in combo:
+                    employee_hours[employee] -= hours
+                    assigned_masks[employee] &= ~shift_bit
+        chosen[shift_index] = ()
 
-                for employee_id in combo:
-                    assignments_by_employee[employee_id].pop()
-                shortages[shift.identifier] = 0
+    search(0, 0.0)
 
-    search(0)
-
-    if best_assignments is None or best_shortages is None:
+    if best_chosen is None:
         raise SolverError("No feasible assignment found")
 
+    assignments: Dict[str, List[str]] = {employee_id: [] for employee_id in problem.employee_ids}
+    shortages: Dict[str, int] = {}
+    for shift_index, combo in enumerate(best_chosen):
+        shift_id = problem.shift_ids[shift_index]
+        for employee in combo:
+            assignments[problem.employee_ids[employee]].append(shift_id)
+        shortages[shift_id] = problem.shift_required[shift_index] - len(combo)
+
     return SolveResult(
         status="Optimal",
         objective_value=best_objective,
-        assignments=best_assignments,
-        shortage_by_shift=best_shortages,
+        assignments=assignments,
+        shortage_by_shift=shortages,
     )
@@ -18,9 +18,18 @@ class TimeIndexer:
 
     @classmethod
     def from_shifts(cls, shifts: Iterable[ShiftDemand], slot_minutes: int) -> "TimeIndexer":
+        shifts = list(shifts)
         start = min(shift.start for shift in shifts)
         end = max(shift.end for shift in shifts)
-        return cls(start=start, end=end, slot_minutes=slot_minutes)
+        indexer = cls(start=start, end=end, slot_minutes=slot_minutes)
+        indexer.validate_alignment(shifts)
+        return indexer
+
+    def validate_alignment(self, shifts: Iterable[ShiftDemand]) -> None:
+        """Raise :class:`ValueError` unless every shift lies on slot boundaries in the horizon."""
+
+        for shift in shifts:
+            self.slots_between(shift.start, shift.end)
 
     @property
     def slot_delta(self) -> timedelta:
@@ -49,8 +58,16 @@ class TimeIndexer:
         slots = end_idx - start_idx
         return slots * (self.slot_minutes / 60)
 
-    def duration_for_shift(self, shift: ShiftDemand) -> float:
-        return self.duration_in_hours(shift.start, shift.end)
+    def duration_for_shift(self, shift: ShiftDemand, *, strict: bool = False) -> float:
+        """Return the length of ``shift`` in hours.
+
+        Alignment is checked once by :meth:`from_shifts`, so by default this is plain datetime
+        arithmetic. Pass ``strict=True`` to re-validate the shift against the slot grid.
+        """
+
+        if strict:
+            return self.duration_in_hours(shift.start, shift.end)
+        return (shift.end - shift.start).total_seconds() / 3600.0
 
     def num_slots(self) -> int:
         total_slots, remainder = divmod(self.end - self.start, self.slot_delta)
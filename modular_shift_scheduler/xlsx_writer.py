@@ -2,8 +2,8 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Sequence
-from xml.etree import ElementTree as ET
+from typing import IO, Dict, List, Sequence
+from xml.sax.saxutils import escape
 import zipfile
 
 
@@ -12,56 +12,120 @@ def write_workbook(
     *,
     employees_rows: Sequence[Sequence[object]],
     shifts_rows: Sequence[Sequence[object]] | None = None,
+    compression: int = zipfile.ZIP_DEFLATED,
+    compresslevel: int = 1,
+    shared_strings: bool = True,
 ) -> None:
     """Write a minimal XLSX workbook containing ``Employees``/``Shifts`` sheets.
 
     The helper emits only the XML parts strictly required by the loader. Keeping the
     implementation in Python allows the repository to avoid committing binary Excel
     files while still providing reproducible fixtures and examples.
+
+    ``compression`` selects the zip method for every part (``zipfile.ZIP_STORED`` skips
+    compression entirely, which is the fastest option for throwaway fixtures) and
+    ``compresslevel`` is its level. The default DEFLATE level of ``1`` is several times faster
+    than zlib's usual level 6 and produces only slightly larger files.
+
+    Text cells are stored once in a shared-strings table and referenced by index, which keeps
+    sheets with repeated names and skills small. Pass ``shared_strings=False`` to write every
+    string inline instead, which avoids the lookup table for sheets of mostly unique text.
     """
 
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    sheet1_xml = _sheet_xml(employees_rows)
-    sheet2_xml = _sheet_xml(shifts_rows) if shifts_rows is not None else None
-
-    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-        archive.writestr("[Content_Types].xml", _content_types_xml(sheet2_xml is not None))
-        archive.writestr("_rels/.rels", _root_relationships_xml())
-        archive.writestr("xl/workbook.xml", _workbook_xml(sheet2_xml is not None))
-        archive.writestr("xl/_rels/workbook.xml.rels", _workbook_relationships_xml(sheet2_xml is not None))
-        archive.writestr("xl/styles.xml", _styles_xml())
-        archive.writestr("xl/worksheets/sheet1.xml", sheet1_xml)
-        if sheet2_xml is not None:
-            archive.writestr("xl/worksheets/sheet2.xml", sheet2_xml)
-
-
-def _sheet_xml(rows: Sequence[Sequence[object]]) -> str:
-    ns = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
-    root = ET.Element("worksheet", xmlns=ns)
-    sheet_data = ET.SubElement(root, "sheetData")
-
+    has_shifts = shifts_rows is not None
+    parts_key = (has_shifts, shared_strings)
+    string_table: Dict[str, int] | None = {} if shared_strings else None
+
+    with zipfile.ZipFile(
+        path, "w", compression=compression, compresslevel=compresslevel
+    ) as archive:
+        archive.writestr("[Content_Types].xml", _CONTENT_TYPES[parts_key])
+        archive.writestr("_rels/.rels", _ROOT_RELATIONSHIPS)
+        archive.writestr("xl/workbook.xml", _WORKBOOK[has_shifts])
+        archive.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELATIONSHIPS[parts_key])
+        archive.writestr("xl/styles.xml", _STYLES)
+        # Sheets are streamed into their entries row by row rather than built as one string.
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as stream:
+            _write_sheet(stream, employees_rows, string_table)
+        if shifts_rows is not None:
+            with archive.open("xl/worksheets/sheet2.xml", "w", force_zip64=True) as stream:
+                _write_sheet(stream, shifts_rows, string_table)
+        # The table is only complete once every sheet has been written.
+        if string_table is not None:
+            with archive.open("xl/sharedStrings.xml", "w", force_zip64=True) as stream:
+                _write_shared_strings(stream, string_table)
+
+
+_WRITE_CHUNK_BYTES = 64 * 1024
+
+
+def _write_sheet(
+    stream: IO[bytes],
+    rows: Sequence[Sequence[object]],
+    string_table: Dict[str, int] | None = None,
+) -> None:
+    # Cells are formatted straight into strings; building an ElementTree per cell dominated the
+    # cost of writing large sheets.
+    # Encoded rows are batched so the zip stream's CRC/compressor is fed in large chunks.
+    buffer = bytearray(
+        b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        b"<sheetData>"
+    )
+    # Every row shares the same columns, so their letters are computed once per sheet.
+    max_columns = max((len(row) for row in rows), default=0)
+    column_letters = _COLUMN_LETTERS[:max_columns] + tuple(
+        _column_letters(index) for index in range(len(_COLUMN_LETTERS) + 1, max_columns + 1)
+    )
     for row_idx, row in enumerate(rows, start=1):
-        row_elem = ET.SubElement(sheet_data, "row", r=str(row_idx))
-        for col_idx, value in enumerate(row, start=1):
+        row_number = str(row_idx)
+        parts: List[str] = [f'<row r="{row_number}">']
+        append = parts.append
+        for col_idx, value in enumerate(row):
             if value is None:
                 continue
-            column_letter = _column_letters(col_idx)
-            cell = ET.SubElement(row_elem, "c", r=f"{column_letter}{row_idx}")
+            reference = column_letters[col_idx] + row_number
             if isinstance(value, str):
-                cell.set("t", "inlineStr")
-                is_elem = ET.SubElement(cell, "is")
-                t_elem = ET.SubElement(is_elem, "t")
-                t_elem.text = value
+                if string_table is None:
+                    append(f'<c r="{reference}" t="inlineStr"><is><t>{escape(value)}</t></is></c>')
+                    continue
+                string_index = string_table.get(value)
+                if string_index is None:
+                    string_index = string_table[value] = len(string_table)
+                append(f'<c r="{reference}" t="s"><v>{string_index}</v></c>')
+            elif isinstance(value, (int, float)):
+                append(f'<c r="{reference}"><v>{value}</v></c>')
             else:
-                v_elem = ET.SubElement(cell, "v")
-                v_elem.text = str(value)
-
-    return ET.tostring(root, encoding="utf-8", xml_declaration=True).decode("utf-8")
+                append(f'<c r="{reference}"><v>{escape(str(value))}</v></c>')
+        append("</row>")
+        buffer += "".join(parts).encode("utf-8")
+        if len(buffer) >= _WRITE_CHUNK_BYTES:
+            stream.write(buffer)
+            buffer.clear()
+    buffer += b"</sheetData></worksheet>"
+    stream.write(buffer)
+
+
+def _write_shared_strings(stream: IO[bytes], string_table: Dict[str, int]) -> None:
+    # Dicts preserve insertion order, which is exactly the index order assigned while writing.
+    buffer = bytearray(
+        b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        b'<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        + f'uniqueCount="{len(string_table)}">'.encode()
+    )
+    for value in string_table:
+        buffer += f"<si><t>{escape(value)}</t></si>".encode()
+        if len(buffer) >= _WRITE_CHUNK_BYTES:
+            stream.write(buffer)
+            buffer.clear()
+    buffer += b"</sst>"
+    stream.write(buffer)
 
 
-def _content_types_xml(include_second_sheet: bool) -> str:
+def _content_types_xml(include_second_sheet: bool, include_shared_strings: bool = False) -> str:
     entries: List[str] = [
         '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>',
         '<Default Extension="xml" ContentType="application/xml"/>',
@@ -74,6 +138,10 @@ def _content_types_xml(include_second_sheet: bool) -> str:
             4,
             '<Override PartName="/xl/worksheets/sheet2.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>',
         )
+    if include_shared_strings:
+        entries.append(
+            '<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>',
+        )
 
     return (
         "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
@@ -107,7 +175,9 @@ def _workbook_xml(include_second_sheet: bool) -> str:
     )
 
 
-def _workbook_relationships_xml(include_second_sheet: bool) -> str:
+def _workbook_relationships_xml(
+    include_second_sheet: bool, include_shared_strings: bool = False
+) -> str:
     entries: List[str] = [
         '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>',
     ]
@@ -115,12 +185,16 @@ def _workbook_relationships_xml(include_second_sheet: bool) -> str:
         entries.append(
             '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet2.xml"/>',
         )
-        style_id = "rId3"
+        style_number = 3
     else:
-        style_id = "rId2"
+        style_number = 2
     entries.append(
-        f'<Relationship Id="{style_id}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>',
+        f'<Relationship Id="rId{style_number}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>',
     )
+    if include_shared_strings:
+        entries.append(
+            f'<Relationship Id="rId{style_number + 1}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/>',
+        )
 
     return (
         "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>"
@@ -144,9 +218,25 @@ def _styles_xml() -> str:
     )
 
 
+# The package scaffolding only varies with the presence of the Shifts sheet and of the
+# shared-strings part, so every variant is rendered and encoded once at import time.
+_VARIANTS = [(sheets, strings) for sheets in (False, True) for strings in (False, True)]
+_CONTENT_TYPES = {key: _content_types_xml(*key).encode("utf-8") for key in _VARIANTS}
+_WORKBOOK = {flag: _workbook_xml(flag).encode("utf-8") for flag in (False, True)}
+_WORKBOOK_RELATIONSHIPS = {
+    key: _workbook_relationships_xml(*key).encode("utf-8") for key in _VARIANTS
+}
+_ROOT_RELATIONSHIPS = _root_relationships_xml().encode("utf-8")
+_STYLES = _styles_xml().encode("utf-8")
+
+
 def _column_letters(index: int) -> str:
     result = ""
     while index > 0:
         index, remainder = divmod(index - 1, 26)
         result = chr(65 + remainder) + result
     return result
+
+
+# Letters for columns A..ZZ, which covers any sheet this module writes in practice.
+_COLUMN_LETTERS = tuple(_column_letters(index) for index in range(1, 26 * 27 + 1))
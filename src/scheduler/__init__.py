@@ -1,5 +1,22 @@
 """Scheduler package public API."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from scheduler.config import AppConfig
-from scheduler.optimizer.solver import SolverOrchestrator
+
+if TYPE_CHECKING:
+    from scheduler.optimizer.solver import SolverOrchestrator
+
+
+def __getattr__(name: str):
+    # The solver pulls in OR-Tools and NumPy; import it only when it is first requested so that
+    # lightweight entry points (e.g. ``scheduler explain``) start quickly.
+    if name == "SolverOrchestrator":
+        from scheduler.optimizer.solver import SolverOrchestrator
+
+        return SolverOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["AppConfig", "SolverOrchestrator"]
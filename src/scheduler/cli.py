@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import logging
 
@@ -11,25 +11,26 @@ from rich.console import Console
 
 from scheduler import reporting
 from scheduler.config import AppConfig
-from scheduler.io.excel_loader import ExcelDataLoader
-from scheduler.io.writers import SolutionWriter
 from scheduler.logging_utils import configure_logging
-from scheduler.optimizer.solver import SolverOrchestrator
 from scheduler.utils import load_config
 
+# The solver, workbook loader and writers import OR-Tools, NumPy and openpyxl. They are imported
+# inside the commands that need them to keep CLI start-up (and ``explain``) fast.
+
 app = typer.Typer(help="Constraint-based workforce scheduling CLI")
 console = Console()
 
 
 def _override_config(config: AppConfig, workbook: Path | None, output: Path | None) -> AppConfig:
-    data = config.model_dump()
+    # model_copy skips re-validating the whole config for a one or two field change.
+    file_updates: Dict[str, Path] = {}
     if workbook is not None:
-        data.setdefault("files", {})
-        data["files"]["workbook_path"] = str(workbook)
+        file_updates["workbook_path"] = Path(workbook)
     if output is not None:
-        data.setdefault("files", {})
-        data["files"]["output_path"] = str(output)
-    return AppConfig(**data)
+        file_updates["output_path"] = Path(output)
+    if not file_updates:
+        return config
+    return config.model_copy(update={"files": config.files.model_copy(update=file_updates)})
 
 
 @app.callback()
@@ -42,6 +43,8 @@ def main(verbose: bool = typer.Option(False, "--verbose", help="Enable verbose l
 def solve(config_path: Path, workbook: Optional[Path] = typer.Option(None), output: Optional[Path] = typer.Option(None)) -> None:
     """Solve the scheduling problem and print a summary."""
 
+    from scheduler.optimizer.solver import SolverOrchestrator
+
     config = load_config(config_path)
     config = _override_config(config, workbook, output)
     orchestrator = SolverOrchestrator(config, base_dir=config_path.parent)
@@ -53,6 +56,8 @@ def solve(config_path: Path, workbook: Optional[Path] = typer.Option(None), outp
 def validate_data(config_path: Path, workbook: Optional[Path] = typer.Option(None)) -> None:
     """Validate the input workbook without solving."""
 
+    from scheduler.io.excel_loader import ExcelDataLoader
+
     config = load_config(config_path)
     config = _override_config(config, workbook, None)
     loader = ExcelDataLoader(config.files.workbook_path)
@@ -77,6 +82,9 @@ def export(
 ) -> None:
     """Solve and export the schedule."""
 
+    from scheduler.io.writers import SolutionWriter
+    from scheduler.optimizer.solver import SolverOrchestrator
+
     config = load_config(config_path)
     config = _override_config(config, workbook, output)
     orchestrator = SolverOrchestrator(config, base_dir=config_path.parent)
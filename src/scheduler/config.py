@@ -1,11 +1,19 @@
 """Configuration models and helpers for the scheduler application."""
 from __future__ import annotations
 
+import copy
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, BaseSettings, Field, PositiveInt, validator
 
+# Shared ISO parser for horizon bounds and workbook timestamps. Entries are keyed by the string,
+# so copies of a config with an updated date never see a stale value, and the datetimes are
+# immutable, so workbook rows repeating a boundary can share one parsed value.
+_parse_iso_datetime = lru_cache(maxsize=4096)(datetime.fromisoformat)
+
 
 class SolverToggles(BaseModel):
     """Enable or disable individual hard constraints."""
@@ -39,6 +47,14 @@ class TimeSettings(BaseModel):
     slot_minutes: PositiveInt = Field(60, description="Length of a time slot in minutes")
     timezone: str = Field("UTC", description="Timezone identifier")
 
+    @property
+    def parsed_start(self) -> datetime:
+        return _parse_iso_datetime(self.start_date)
+
+    @property
+    def parsed_end(self) -> datetime:
+        return _parse_iso_datetime(self.end_date)
+
 
 class FileSettings(BaseModel):
     """Paths to input and output artefacts."""
@@ -53,6 +69,10 @@ class SolverSettings(BaseModel):
     time_limit_seconds: Optional[int] = Field(None, ge=1)
     log_search_progress: bool = False
     num_workers: Optional[int] = Field(None, ge=1)
+    interleave_search: bool = True
+    share_binary_clauses: bool = True
+    fast_build: bool = False
+    lazy_constraints: bool = False
 
 
 class AppConfig(BaseSettings):
@@ -70,43 +90,58 @@ class AppConfig(BaseSettings):
 
     @classmethod
     def load(cls, path: Path | str) -> "AppConfig":
-        """Load configuration from a JSON or YAML file."""
+        """Load configuration from a JSON or YAML file.
+
+        Parsed file contents are cached by resolved path, modification time and size. The model
+        is built from them on every call, so ``SCHEDULER_*`` environment overrides are always
+        re-read.
+        """
 
         path = Path(path)
         if not path.exists():
             raise FileNotFoundError(path)
 
-        text = path.read_text()
-        suffix = path.suffix.lower()
+        stat = path.stat()
+        data = _read_config_file_cached(path.resolve(), stat.st_mtime_ns, stat.st_size)
+        return cls(**copy.deepcopy(data))
+
 
-        if suffix in {".yaml", ".yml"}:
-            import yaml
+@lru_cache(maxsize=32)
+def _read_config_file_cached(path: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+    # ``mtime_ns`` and ``size`` only participate in the cache key.
+    return _read_config_file(path)
 
-            data: Dict[str, object] = yaml.safe_load(text) or {}
-        elif suffix == ".json":
-            import json
 
-            data = json.loads(text)
-        else:
-            raise ValueError(f"Unsupported config format: {suffix}")
+def _read_config_file(path: Path) -> Dict[str, Any]:
+    text = path.read_text()
+    suffix = path.suffix.lower()
 
-        return cls(**data)
+    if suffix in {".yaml", ".yml"}:
+        import yaml
+
+        # The libyaml-backed loader is much faster when PyYAML was built with it.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data: Dict[str, Any] = yaml.load(text, Loader=loader) or {}
+    elif suffix == ".json":
+        import json
+
+        data = json.loads(text)
+    else:
+        raise ValueError(f"Unsupported config format: {suffix}")
+
+    return data
 
 
 def resolve_paths(config: AppConfig, base_dir: Optional[Path] = None) -> AppConfig:
     """Return a copy of ``config`` with paths resolved relative to ``base_dir``."""
 
     base_dir = base_dir or Path.cwd()
-    data = config.model_dump()
-
-    files: Dict[str, object] = data.get("files", {})
+    updates: Dict[str, Path] = {}
     for key in ("workbook_path", "output_path"):
-        value = files.get(key)
+        value = getattr(config.files, key)
         if value is not None:
-            files[key] = str((base_dir / value).resolve())
-    data["files"] = files
-
-    return AppConfig(**data)
+            updates[key] = (base_dir / value).resolve()
+    return config.model_copy(update={"files": config.files.model_copy(update=updates)})
 
 
 __all__ = [
@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable, Protocol
+from typing import Protocol
 
 from scheduler.data_models import SchedulingInputs
-from scheduler.time_index import TimeSlot
+from scheduler.time_index import SlotTable
 
 
 class BackendProtocol(Protocol):
@@ -22,7 +22,7 @@ class Constraint(ABC):
         self.name = name
 
     @abstractmethod
-    def apply(self, backend: BackendProtocol, inputs: SchedulingInputs, slots: Iterable[TimeSlot]) -> None:
+    def apply(self, backend: BackendProtocol, inputs: SchedulingInputs, slots: SlotTable) -> None:
         """Apply the constraint to the backend."""
 
 
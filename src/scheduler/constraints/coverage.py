@@ -1,12 +1,11 @@
 """Coverage constraints."""
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Iterable
+import numpy as np
 
 from scheduler.constraints.base import BackendProtocol, Constraint
 from scheduler.data_models import SchedulingInputs
-from scheduler.time_index import TimeSlot
+from scheduler.time_index import SlotTable
 
 
 class CoverageConstraint(Constraint):
@@ -15,22 +14,25 @@ class CoverageConstraint(Constraint):
     def __init__(self) -> None:
         super().__init__(name="coverage")
 
-    def apply(self, backend: BackendProtocol, inputs: SchedulingInputs, slots: Iterable[TimeSlot]) -> None:
-        slot_to_demand = defaultdict(int)
-        slot_list = list(slots)
-        for demand in inputs.demand:
-            for slot in slot_list:
-                if slot.start < demand.end and demand.start < slot.end:
-                    slot_to_demand[slot.index] = max(slot_to_demand[slot.index], demand.required_staff)
-
-        for slot in slot_list:
-            demand = slot_to_demand.get(slot.index)
+    def apply(self, backend: BackendProtocol, inputs: SchedulingInputs, slots: SlotTable) -> None:
+        if not len(slots) or not inputs.demand:
+            return
+
+        # Overlaps are evaluated as one slots x demands matrix instead of a nested Python loop.
+        demand_start = slots.as_wall_clock(demand.start for demand in inputs.demand)
+        demand_end = slots.as_wall_clock(demand.end for demand in inputs.demand)
+        demand_staff = np.array([demand.required_staff for demand in inputs.demand], dtype=np.int64)
+        overlap = (slots.start[:, None] < demand_end[None, :]) & (
+            demand_start[None, :] < slots.end[:, None]
+        )
+        required = np.where(overlap, demand_staff[None, :], 0).max(axis=1)
+
+        employee_ids = [employee.id for employee in inputs.employees]
+        for slot_index, demand in zip(slots.indices.tolist(), required.tolist()):
             if not demand:
                 continue
-            expr = []
-            for employee in inputs.employees:
-                expr.append(backend.get_variable(employee.id, slot.index))
-            backend.add_constraint(expr, ">=", demand, name=f"coverage_{slot.index}")
+            expr = [backend.get_variable(employee_id, slot_index) for employee_id in employee_ids]
+            backend.add_constraint(expr, ">=", demand, name=f"coverage_{slot_index}")
 
 
 __all__ = ["CoverageConstraint"]
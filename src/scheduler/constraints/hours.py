@@ -1,11 +1,13 @@
 """Working hours constraints."""
 from __future__ import annotations
 
-from typing import Iterable
+import math
+
+import numpy as np
 
 from scheduler.constraints.base import BackendProtocol, Constraint
 from scheduler.data_models import SchedulingInputs
-from scheduler.time_index import TimeSlot
+from scheduler.time_index import SlotTable
 
 
 class MaxHoursConstraint(Constraint):
@@ -14,14 +16,16 @@ class MaxHoursConstraint(Constraint):
     def __init__(self) -> None:
         super().__init__(name="max_hours")
 
-    def apply(self, backend: BackendProtocol, inputs: SchedulingInputs, slots: Iterable[TimeSlot]) -> None:
-        slots_list = list(slots)
+    def apply(self, backend: BackendProtocol, inputs: SchedulingInputs, slots: SlotTable) -> None:
+        # CP-SAT only accepts integer coefficients, so hours are counted in whole minutes. Slot
+        # lengths do not depend on the employee and are computed once by the slot table.
+        nonzero = slots.duration_minutes > 0
+        active = list(zip(slots.indices[nonzero].tolist(), slots.duration_minutes[nonzero].tolist()))
+        get_variable = backend.get_variable
         for employee in inputs.employees:
-            expr = []
-            for slot in slots_list:
-                var = backend.get_variable(employee.id, slot.index)
-                expr.append((var, slot.duration_hours))
-            backend.add_constraint(expr, "<=", employee.max_hours_per_week, name=f"max_hours_{employee.id}")
+            expr = [(get_variable(employee.id, index), minutes) for index, minutes in active]
+            max_minutes = math.floor(employee.max_hours_per_week * 60 + 1e-6)
+            backend.add_constraint(expr, "<=", max_minutes, name=f"max_hours_{employee.id}")
 
 
 class DailyLimitConstraint(Constraint):
@@ -30,16 +34,23 @@ class DailyLimitConstraint(Constraint):
     def __init__(self) -> None:
         super().__init__(name="daily_limit")
 
-    def apply(self, backend: BackendProtocol, inputs: SchedulingInputs, slots: Iterable[TimeSlot]) -> None:
-        slots_by_day = {}
-        for slot in slots:
-            day = slot.start.date()
-            slots_by_day.setdefault(day, []).append(slot)
-
+    def apply(self, backend: BackendProtocol, inputs: SchedulingInputs, slots: SlotTable) -> None:
+        # The table is in start order, so each day is one contiguous run of slots.
+        boundaries = np.flatnonzero(slots.day[1:] != slots.day[:-1]) + 1
+        starts = [0, *boundaries.tolist()]
+        slots_by_day = [
+            (str(slots.day[first]), indices.tolist())
+            for first, indices in zip(starts, np.split(slots.indices, boundaries))
+            if len(indices)
+        ]
+
+        get_variable = backend.get_variable
+        add_constraint = backend.add_constraint
         for employee in inputs.employees:
-            for day, day_slots in slots_by_day.items():
-                vars_ = [backend.get_variable(employee.id, slot.index) for slot in day_slots]
-                backend.add_constraint(vars_, "<=", 1, name=f"daily_limit_{employee.id}_{day}")
+            employee_id = employee.id
+            for day, indices in slots_by_day:
+                vars_ = [get_variable(employee_id, index) for index in indices]
+                add_constraint(vars_, "<=", 1, name=f"daily_limit_{employee_id}_{day}")
 
 
 __all__ = ["MaxHoursConstraint", "DailyLimitConstraint"]
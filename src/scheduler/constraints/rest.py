@@ -1,11 +1,9 @@
 """Rest period constraints."""
 from __future__ import annotations
 
-from typing import Iterable
-
 from scheduler.constraints.base import BackendProtocol, Constraint
 from scheduler.data_models import SchedulingInputs
-from scheduler.time_index import TimeSlot
+from scheduler.time_index import SlotTable
 
 
 class RestPeriodConstraint(Constraint):
@@ -15,19 +13,19 @@ class RestPeriodConstraint(Constraint):
         super().__init__(name="rest_period")
         self.min_rest_slots = min_rest_slots
 
-    def apply(self, backend: BackendProtocol, inputs: SchedulingInputs, slots: Iterable[TimeSlot]) -> None:
-        slots_list = list(slots)
+    def apply(self, backend: BackendProtocol, inputs: SchedulingInputs, slots: SlotTable) -> None:
+        indices = slots.indices.tolist()
+        if self.min_rest_slots <= 0 or len(indices) < 2:
+            return
+        # At most one assignment in every window of min_rest_slots + 1 consecutive slots is
+        # equivalent to the pairwise x_i + x_{i+j} <= 1 rows, with min_rest_slots times fewer
+        # constraints. A horizon shorter than one window collapses into a single window.
+        window = min(self.min_rest_slots + 1, len(indices))
+        get_variable = backend.get_variable
         for employee in inputs.employees:
-            for i, slot in enumerate(slots_list):
-                for j in range(1, self.min_rest_slots + 1):
-                    if i + j < len(slots_list):
-                        other_slot = slots_list[i + j]
-                        backend.add_constraint(
-                            [backend.get_variable(employee.id, slot.index), backend.get_variable(employee.id, other_slot.index)],
-                            "<=",
-                            1,
-                            name=f"rest_{employee.id}_{slot.index}_{other_slot.index}",
-                        )
+            for i in range(len(indices) - window + 1):
+                window_vars = [get_variable(employee.id, index) for index in indices[i : i + window]]
+                backend.add_constraint(window_vars, "<=", 1, name=f"rest_{employee.id}_{indices[i]}")
 
 
 __all__ = ["RestPeriodConstraint"]
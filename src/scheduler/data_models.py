@@ -1,11 +1,17 @@
 """Domain data models used by the scheduler."""
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import datetime, time
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
-from pydantic import BaseModel, Field, PositiveInt, validator
+from pydantic import BaseModel, Field, PositiveInt, PrivateAttr, validator
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from scheduler.time_index import TimeSlot
 
 
 class PreferenceLevel(str, Enum):
@@ -67,6 +73,12 @@ class SchedulingInputs(BaseModel):
     def employees_by_id(self) -> Dict[str, Employee]:
         return {employee.id: employee for employee in self.employees}
 
+    def availability_by_preference(self) -> Dict[PreferenceLevel, List[AvailabilityBlock]]:
+        grouped: Dict[PreferenceLevel, List[AvailabilityBlock]] = defaultdict(list)
+        for block in self.availability:
+            grouped[block.preference].append(block)
+        return grouped
+
 
 class AssignmentDecision(BaseModel):
     """Single assignment decision."""
@@ -94,6 +106,52 @@ class ScheduleSolution(BaseModel):
     objective_value: Optional[float]
     assignments: List[AssignmentDecision]
     statistics: Dict[str, float] = Field(default_factory=dict)
+    _assignment_values: Any = PrivateAttr(default=None)
+    _assignment_axes: Any = PrivateAttr(default=None)
+
+    @classmethod
+    def from_values(
+        cls,
+        status: SolverStatus,
+        objective_value: Optional[float],
+        values: "np.ndarray",
+        employee_ids: Sequence[str],
+        slots: Sequence["TimeSlot"],
+    ) -> "ScheduleSolution":
+        """Build a solution from a boolean ``(employees, slots)`` assignment matrix.
+
+        Only assigned cells become :class:`AssignmentDecision` entries; the full matrix and its
+        axes stay available through :attr:`assignment_values` and :attr:`assignment_axes`.
+        """
+
+        assignments: List[AssignmentDecision] = []
+        for employee_pos, slot_pos in zip(*(axis.tolist() for axis in values.nonzero())):
+            slot = slots[slot_pos]
+            assignments.append(
+                AssignmentDecision(
+                    employee_id=employee_ids[employee_pos],
+                    slot_index=slot.index,
+                    start=slot.start,
+                    end=slot.end,
+                    is_assigned=True,
+                )
+            )
+        solution = cls(status=status, objective_value=objective_value, assignments=assignments)
+        solution._assignment_values = values
+        solution._assignment_axes = (tuple(employee_ids), tuple(slots))
+        return solution
+
+    @property
+    def assignment_values(self) -> Optional["np.ndarray"]:
+        """Boolean ``(employees, slots)`` matrix from the solver, when the solution came from one."""
+
+        return self._assignment_values
+
+    @property
+    def assignment_axes(self) -> Optional[Tuple[Sequence[str], Sequence["TimeSlot"]]]:
+        """Employee ids and time slots labelling the rows and columns of ``assignment_values``."""
+
+        return self._assignment_axes
 
 
 __all__ = [
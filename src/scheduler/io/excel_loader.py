@@ -3,27 +3,38 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Any, Callable, Dict, Iterator, List, Mapping, TypeVar
 
-import pandas as pd
+import openpyxl
 from pydantic import ValidationError
 
+from scheduler.config import _parse_iso_datetime
 from scheduler.data_models import AvailabilityBlock, Employee, PreferenceLevel, SchedulingInputs, ShiftDemand
 
 
+ModelT = TypeVar("ModelT")
+
+
 class ExcelStructureError(RuntimeError):
     """Raised when the workbook does not match expectations."""
 
 
 class ExcelDataLoader:
-    """Load scheduler inputs from a structured Excel workbook."""
+    """Load scheduler inputs from a structured Excel workbook.
+
+    With ``unsafe=True`` only the first ``validated_rows`` rows of each sheet go through full
+    Pydantic validation; the remaining rows are built with ``model_construct``. Use it only for
+    trusted workbooks: later rows skip range and ordering checks.
+    """
 
     required_sheets = {"employees", "availability", "demand"}
+    validated_rows = 10
 
-    def __init__(self, path: Path | str) -> None:
+    def __init__(self, path: Path | str, *, unsafe: bool = False) -> None:
         self.path = Path(path)
+        self.unsafe = unsafe
 
-    def validate_structure(self, workbook: Dict[str, pd.DataFrame]) -> None:
+    def validate_structure(self, workbook: Mapping[str, object]) -> None:
         missing = self.required_sheets - set(workbook)
         if missing:
             raise ExcelStructureError(f"Workbook missing sheets: {', '.join(sorted(missing))}")
@@ -33,48 +44,77 @@ class ExcelDataLoader:
         if isinstance(value, datetime):
             return value
         if isinstance(value, str):
-            return datetime.fromisoformat(value)
+            return _parse_iso_datetime(value)
         raise TypeError(f"Cannot parse datetime from {value!r}")
 
     def load(self) -> SchedulingInputs:
         if not self.path.exists():
             raise FileNotFoundError(self.path)
 
-        workbook = pd.read_excel(self.path, sheet_name=None)
-        self.validate_structure(workbook)
-
-        employees = [self._parse_employee(row) for _, row in workbook["employees"].iterrows()]
-        availability = [self._parse_availability(row) for _, row in workbook["availability"].iterrows()]
-        demand = [self._parse_demand(row) for _, row in workbook["demand"].iterrows()]
+        workbook = openpyxl.load_workbook(self.path, read_only=True, data_only=True)
+        try:
+            self.validate_structure({name: None for name in workbook.sheetnames})
+            employees = self._parse_sheet(workbook["employees"], self._parse_employee)
+            availability = self._parse_sheet(workbook["availability"], self._parse_availability)
+            demand = self._parse_sheet(workbook["demand"], self._parse_demand)
+        finally:
+            workbook.close()
 
         inputs = SchedulingInputs(employees=employees, availability=availability, demand=demand)
         self._validate_inputs(inputs)
         return inputs
 
-    def _parse_employee(self, row: pd.Series) -> Employee:
+    def _parse_sheet(self, sheet, parse: Callable[..., ModelT]) -> List[ModelT]:
+        return [
+            parse(row, validate=not self.unsafe or position < self.validated_rows)
+            for position, row in enumerate(self._iter_records(sheet))
+        ]
+
+    @staticmethod
+    def _iter_records(sheet) -> Iterator[Dict[str, Any]]:
+        """Yield each non-blank row of ``sheet`` keyed by the header row; empty cells are omitted."""
+
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [(idx, str(label)) for idx, label in enumerate(header) if label is not None]
+        for values in rows:
+            record = {
+                label: values[idx] for idx, label in columns if idx < len(values) and values[idx] is not None
+            }
+            if record:
+                yield record
+
+    def _parse_employee(self, row: Mapping[str, Any], *, validate: bool = True) -> Employee:
         skills_raw = row.get("skills")
         skills: List[str] = []
         if isinstance(skills_raw, str):
             skills = [skill.strip() for skill in skills_raw.split(",") if skill.strip()]
 
-        return Employee(
+        factory = Employee if validate else Employee.model_construct
+        return factory(
             id=str(row["id"]),
             name=str(row.get("name", row["id"])),
             max_hours_per_week=float(row.get("max_hours_per_week", 40)),
             skills=skills,
         )
 
-    def _parse_availability(self, row: pd.Series) -> AvailabilityBlock:
+    def _parse_availability(
+        self, row: Mapping[str, Any], *, validate: bool = True
+    ) -> AvailabilityBlock:
         preference = PreferenceLevel(row.get("preference", PreferenceLevel.neutral))
-        return AvailabilityBlock(
+        factory = AvailabilityBlock if validate else AvailabilityBlock.model_construct
+        return factory(
             employee_id=str(row["employee_id"]),
             start=self._parse_datetime(row["start"]),
             end=self._parse_datetime(row["end"]),
             preference=preference,
         )
 
-    def _parse_demand(self, row: pd.Series) -> ShiftDemand:
-        return ShiftDemand(
+    def _parse_demand(self, row: Mapping[str, Any], *, validate: bool = True) -> ShiftDemand:
+        factory = ShiftDemand if validate else ShiftDemand.model_construct
+        return factory(
             start=self._parse_datetime(row["start"]),
             end=self._parse_datetime(row["end"]),
             required_staff=int(row.get("required_staff", 1)),
@@ -82,9 +122,9 @@ class ExcelDataLoader:
         )
 
     def _validate_inputs(self, inputs: SchedulingInputs) -> None:
-        employees = inputs.employees_by_id()
+        employee_ids = frozenset(employee.id for employee in inputs.employees)
         for block in inputs.availability:
-            if block.employee_id not in employees:
+            if block.employee_id not in employee_ids:
                 raise ValidationError(
                     [
                         {
@@ -96,8 +136,10 @@ class ExcelDataLoader:
                     AvailabilityBlock,
                 )
 
-        demand_span = sorted((demand.start, demand.end) for demand in inputs.demand)
-        if demand_span and demand_span[0][0] >= demand_span[-1][1]:
+        # Only the outer bounds matter, so a linear min/max replaces sorting every window.
+        first_start = min((demand.start for demand in inputs.demand), default=None)
+        last_end = max((demand.end for demand in inputs.demand), default=None)
+        if first_start is not None and last_end is not None and first_start >= last_end:
             raise ValidationError(
                 [
                     {
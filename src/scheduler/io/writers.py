@@ -1,11 +1,11 @@
 """Writers for exporting solver output."""
 from __future__ import annotations
 
+import csv
+from operator import attrgetter
 from pathlib import Path
 from typing import Iterable
 
-import pandas as pd
-
 from scheduler.data_models import AssignmentDecision, ScheduleSolution
 
 
@@ -19,22 +19,38 @@ class SolutionWriter:
     def to_csv(self, solution: ScheduleSolution, filename: str = "schedule.csv") -> Path:
         """Write assignment decisions to a CSV file."""
 
-        records = [decision.model_dump() for decision in solution.assignments if decision.is_assigned]
-        df = pd.DataFrame.from_records(records)
+        fields = list(AssignmentDecision.model_fields)
+        row_values = attrgetter(*fields)
         path = self.output_dir / filename
-        df.to_csv(path, index=False)
+        with path.open("w", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(fields)
+            writer.writerows(
+                row_values(decision) for decision in solution.assignments if decision.is_assigned
+            )
         return path
 
     def to_excel(self, solution: ScheduleSolution, filename: str = "schedule.xlsx") -> Path:
         """Write assignment decisions to an Excel workbook."""
 
+        from openpyxl import Workbook
+
+        # A write-only openpyxl workbook streams rows straight to the file without the pandas
+        # DataFrame and ExcelWriter layers.
+        fields = list(AssignmentDecision.model_fields)
+        row_values = attrgetter(*fields)
+        workbook = Workbook(write_only=True)
+        assignments = workbook.create_sheet("assignments")
+        assignments.append(fields)
+        for decision in solution.assignments:
+            assignments.append(row_values(decision))
+        metrics = workbook.create_sheet("metrics")
+        metrics.append(("metric", "value"))
+        for key, value in solution.statistics.items():
+            metrics.append((key, value))
+
         path = self.output_dir / filename
-        with pd.ExcelWriter(path) as writer:
-            assignments = [decision.model_dump() for decision in solution.assignments]
-            pd.DataFrame.from_records(assignments).to_excel(writer, sheet_name="assignments", index=False)
-            pd.DataFrame.from_records([
-                {"metric": key, "value": value} for key, value in solution.statistics.items()
-            ]).to_excel(writer, sheet_name="metrics", index=False)
+        workbook.save(path)
         return path
 
 
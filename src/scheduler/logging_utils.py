@@ -2,18 +2,43 @@
 from __future__ import annotations
 
 import logging
+import sys
 from typing import Optional
 
-from rich.logging import RichHandler
+# Handler installed on the root logger by ``configure_logging``, reused by later calls.
+_handler: Optional[logging.Handler] = None
+_handler_uses_rich = False
+
+
+def _build_handler(use_rich: bool) -> logging.Handler:
+    if use_rich:
+        from rich.logging import RichHandler
+
+        handler: logging.Handler = RichHandler(rich_tracebacks=True)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+    else:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    return handler
 
 
 def configure_logging(level: int = logging.INFO, enable_rich: bool = True) -> None:
-    """Configure logging for CLI usage."""
+    """Configure logging for CLI usage.
+
+    Rich output is only used when stderr is a terminal; redirected output gets a plain stream
+    handler. Repeated calls replace the handler from the previous call instead of adding another.
+    """
 
-    handlers = None
-    if enable_rich:
-        handlers = [RichHandler(rich_tracebacks=True)]
-    logging.basicConfig(level=level, handlers=handlers, format="%(message)s")
+    global _handler, _handler_uses_rich
+    use_rich = enable_rich and sys.stderr.isatty()
+    root = logging.getLogger()
+    if _handler is None or _handler_uses_rich != use_rich:
+        if _handler is not None:
+            root.removeHandler(_handler)
+        _handler = _build_handler(use_rich)
+        _handler_uses_rich = use_rich
+        root.addHandler(_handler)
+    root.setLevel(level)
 
 
 __all__ = ["configure_logging"]
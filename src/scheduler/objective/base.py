@@ -2,15 +2,30 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable, Protocol
+from typing import List, Mapping, Protocol, Sequence
 
-from scheduler.data_models import SchedulingInputs
-from scheduler.time_index import TimeSlot
+import numpy as np
+
+from scheduler.data_models import AvailabilityBlock, PreferenceLevel, SchedulingInputs
+from scheduler.time_index import SlotTable, TimeSlot
 
 
 class BackendProtocol(Protocol):
     def get_variable(self, employee_id: str, slot_index: int): ...
-    def add_weighted_sum(self, terms, weight: float, name: str): ...
+    def variables_for(self, employee_id: str) -> Sequence: ...
+    def add_weighted_sum(self, variables, coefficients, weight: float, name: str): ...
+
+    @property
+    def weekend_slot_indices(self) -> Sequence[int]: ...
+
+    @property
+    def slot_soa(self) -> SlotTable: ...
+
+    @property
+    def duration_hours(self) -> np.ndarray: ...
+
+    @property
+    def availability_by_pref(self) -> Mapping[PreferenceLevel, List[AvailabilityBlock]]: ...
 
 
 class ObjectiveTerm(ABC):
@@ -22,8 +37,14 @@ class ObjectiveTerm(ABC):
         self.name = name
         self.weight = weight
 
+    @staticmethod
+    def is_enabled(weight: float) -> bool:
+        """Whether a term with ``weight`` contributes anything; non-positive weights disable it."""
+
+        return weight > 0
+
     @abstractmethod
-    def apply(self, backend: BackendProtocol, inputs: SchedulingInputs, slots: Iterable[TimeSlot]) -> None:
+    def apply(self, backend: BackendProtocol, inputs: SchedulingInputs, slots: Sequence[TimeSlot]) -> None:
         """Register the objective contribution."""
 
 
@@ -1,34 +1,44 @@
 """Preference-based objective terms."""
 from __future__ import annotations
 
-from typing import Iterable
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import Sequence
 
 from scheduler.data_models import PreferenceLevel, SchedulingInputs
 from scheduler.objective.base import ObjectiveTerm
 from scheduler.time_index import TimeSlot
 
 
+_slot_start = attrgetter("start")
+_slot_end = attrgetter("end")
+
+
 class PreferenceSatisfaction(ObjectiveTerm):
     """Reward assignments that align with employee preferences."""
 
     def __init__(self, weight: float) -> None:
         super().__init__(name="preference_satisfaction", weight=weight)
 
-    def apply(self, backend, inputs: SchedulingInputs, slots: Iterable[TimeSlot]) -> None:  # type: ignore[override]
-        terms = []
-        for block in inputs.availability:
-            if block.preference == PreferenceLevel.preferred:
-                for slot in slots:
-                    if block.start <= slot.start and slot.end <= block.end:
-                        var = backend.get_variable(block.employee_id, slot.index)
-                        terms.append((var, 1.0))
-            elif block.preference == PreferenceLevel.unavailable:
-                for slot in slots:
-                    if block.start <= slot.start and slot.end <= block.end:
-                        var = backend.get_variable(block.employee_id, slot.index)
-                        terms.append((var, -2.0))
-        if terms:
-            backend.add_weighted_sum(terms, self.weight, name=self.name)
+    def apply(self, backend, inputs: SchedulingInputs, slots: Sequence[TimeSlot]) -> None:  # type: ignore[override]
+        if not self.is_enabled(self.weight):
+            return
+        # Slots are contiguous and ordered, so the slots inside a block form one run that two
+        # binary searches locate without scanning the whole horizon. ``slots`` is in the backend's
+        # column order, so that run is also a slice of the employee's row of variables.
+        by_preference = {PreferenceLevel.preferred: 1.0, PreferenceLevel.unavailable: -2.0}
+        variables = []
+        coefficients = []
+        for preference, coefficient in by_preference.items():
+            for block in backend.availability_by_pref.get(preference, ()):
+                lo = bisect_left(slots, block.start, key=_slot_start)
+                hi = bisect_right(slots, block.end, key=_slot_end)
+                if lo >= hi:
+                    continue
+                variables.extend(backend.variables_for(block.employee_id)[lo:hi])
+                coefficients.extend([coefficient] * (hi - lo))
+        if variables:
+            backend.add_weighted_sum(variables, coefficients, self.weight, name=self.name)
 
 
 class WeekendDistribution(ObjectiveTerm):
@@ -37,13 +47,16 @@ class WeekendDistribution(ObjectiveTerm):
     def __init__(self, weight: float) -> None:
         super().__init__(name="weekend_distribution", weight=weight)
 
-    def apply(self, backend, inputs: SchedulingInputs, slots: Iterable[TimeSlot]) -> None:  # type: ignore[override]
-        weekend_slots = [slot for slot in slots if slot.start.weekday() >= 5]
-        if not weekend_slots:
+    def apply(self, backend, inputs: SchedulingInputs, slots: Sequence[TimeSlot]) -> None:  # type: ignore[override]
+        if not self.is_enabled(self.weight):
             return
+        weekend_indices = backend.weekend_slot_indices
+        if not weekend_indices:
+            return
+        coefficients = [1.0] * len(weekend_indices)
         for employee in inputs.employees:
-            terms = [(backend.get_variable(employee.id, slot.index), 1.0) for slot in weekend_slots]
-            backend.add_weighted_sum(terms, self.weight, name=f"weekend_{employee.id}")
+            variables = [backend.get_variable(employee.id, index) for index in weekend_indices]
+            backend.add_weighted_sum(variables, coefficients, self.weight, name=f"weekend_{employee.id}")
 
 
 class OvertimePenalty(ObjectiveTerm):
@@ -53,14 +66,16 @@ class OvertimePenalty(ObjectiveTerm):
         super().__init__(name="overtime_penalty", weight=weight)
         self.overtime_threshold = overtime_threshold
 
-    def apply(self, backend, inputs: SchedulingInputs, slots: Iterable[TimeSlot]) -> None:  # type: ignore[override]
-        slots_list = list(slots)
+    def apply(self, backend, inputs: SchedulingInputs, slots: Sequence[TimeSlot]) -> None:  # type: ignore[override]
+        if not self.is_enabled(self.weight):
+            return
+        # Slot lengths are precomputed by the backend in the same order as each employee's row
+        # of variables, so no per-slot lookup is needed.
+        hours = backend.duration_hours.tolist()
+        weight = self.weight / max(self.overtime_threshold, 1.0)
         for employee in inputs.employees:
-            terms = []
-            for slot in slots_list:
-                var = backend.get_variable(employee.id, slot.index)
-                terms.append((var, slot.duration_hours))
-            backend.add_weighted_sum(terms, self.weight / max(self.overtime_threshold, 1.0), name=f"overtime_{employee.id}")
+            variables = backend.variables_for(employee.id)
+            backend.add_weighted_sum(variables, hours, weight, name=f"overtime_{employee.id}")
 
 
 __all__ = ["PreferenceSatisfaction", "WeekendDistribution", "OvertimePenalty"]
@@ -1,48 +1,114 @@
 """CP-SAT backend abstractions."""
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Sequence, Tuple
 
+import numpy as np
 from ortools.sat.python import cp_model
 
 from scheduler.data_models import SchedulingInputs
-from scheduler.time_index import TimeSlot
+from scheduler.objective.base import ObjectiveTerm
+from scheduler.time_index import SlotTable, TimeSlot
+
+_BOOL_DOMAIN = cp_model.Domain(0, 1)
+# Wrapping a variable directly on the model proto needs the pybind ``IntVar`` API of newer
+# OR-Tools releases; older ones fall back to unnamed ``new_bool_var`` calls.
+_PROTO_INT_VAR = hasattr(cp_model.IntVar, "with_domain")
+
+# CP-SAT's portfolio search stops scaling past this many workers and can get markedly slower.
+MAX_SEARCH_WORKERS = 8
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class SolverResult:
     status: int
     solver: cp_model.CpSolver
+    num_workers: int = MAX_SEARCH_WORKERS
 
 
 class CPSatBackend:
-    """Thin wrapper around OR-Tools CP-SAT for workforce scheduling."""
+    """Thin wrapper around OR-Tools CP-SAT for workforce scheduling.
 
-    def __init__(self, inputs: SchedulingInputs, slots: Iterable[TimeSlot]) -> None:
+    With ``fast_build`` the assignment variables are created unnamed, directly on the model proto,
+    skipping the name and domain handling of ``new_bool_var``.
+    """
+
+    def __init__(self, inputs: SchedulingInputs, slots: Iterable[TimeSlot], *, fast_build: bool = False) -> None:
         self.inputs = inputs
-        self.slots = list(slots)
+        self.fast_build = fast_build
+        # Input lookups shared by objective terms and the assignment matrix rows.
+        self.availability_by_pref = inputs.availability_by_preference()
+        self.employee_ids: Tuple[str, ...] = tuple(employee.id for employee in inputs.employees)
+        self.employee_index: Dict[str, int] = {
+            employee_id: row for row, employee_id in enumerate(self.employee_ids)
+        }
+        # Slot data shared by constraints, objective terms and reporting, computed once per model.
+        # ``slots`` follows the table's start order so variable columns line up with its rows.
+        self.slot_soa = SlotTable.from_slots(slots)
+        self.slots: Sequence[TimeSlot] = self.slot_soa.slots
+        self.duration_hours = self.slot_soa.duration_hours
+        self.weekend_slot_indices: Tuple[int, ...] = tuple(
+            self.slot_soa.indices[self.slot_soa.weekday >= 5].tolist()
+        )
+        self._slot_column: Dict[int, int] = {
+            slot.index: column for column, slot in enumerate(self.slots)
+        }
         self.model = cp_model.CpModel()
-        self._variables: Dict[Tuple[str, int], cp_model.IntVar] = {}
-        self._objective_terms: List[Tuple[cp_model.LinearExpr, float]] = []
+        # Assignment variables laid out as [employee row][slot column]; rows follow
+        # ``employee_index`` and columns follow ``slots``.
+        self._var_matrix: List[List[cp_model.IntVar]] = []
+        self._objective_terms: List[cp_model.LinearExpr] = []
         self._build_variables()
 
     def _build_variables(self) -> None:
+        if self.fast_build and _PROTO_INT_VAR:
+            proto = self.model.model_proto
+            new_var = cp_model.IntVar
+            for _ in self.inputs.employees:
+                self._var_matrix.append([new_var(proto).with_domain(_BOOL_DOMAIN) for _ in self.slots])
+            return
+        if self.fast_build:
+            new_bool_var = self.model.new_bool_var
+            for _ in self.inputs.employees:
+                self._var_matrix.append([new_bool_var("") for _ in self.slots])
+            return
+
+        new_bool_var = self.model.new_bool_var
         for employee in self.inputs.employees:
-            for slot in self.slots:
-                var = self.model.NewBoolVar(f"assign_{employee.id}_{slot.index}")
-                self._variables[(employee.id, slot.index)] = var
+            self._var_matrix.append(
+                [new_bool_var(f"assign_{employee.id}_{slot.index}") for slot in self.slots]
+            )
 
     def get_variable(self, employee_id: str, slot_index: int) -> cp_model.IntVar:
-        return self._variables[(employee_id, slot_index)]
+        return self._var_matrix[self.employee_index[employee_id]][self._slot_column[slot_index]]
+
+    def variables_for(self, employee_id: str) -> List[cp_model.IntVar]:
+        """Return the employee's assignment variables for every slot, in ``slots`` order."""
+
+        return self._var_matrix[self.employee_index[employee_id]]
+
+    @property
+    def _variables(self) -> Dict[Tuple[str, int], cp_model.IntVar]:
+        """Variables keyed by ``(employee_id, slot_index)``, rebuilt from the matrix on access."""
+
+        return {
+            (employee_id, slot.index): var
+            for employee_id, row in zip(self.employee_ids, self._var_matrix)
+            for slot, var in zip(self.slots, row)
+        }
 
     def add_constraint(self, terms, operator: str, rhs: float, name: str | None = None) -> None:
         if not terms:
             return
         if isinstance(terms[0], tuple):
-            expr = sum(coeff * var for var, coeff in terms)
+            variables, coefficients = zip(*terms)
+            expr = cp_model.LinearExpr.WeightedSum(variables, coefficients)
         else:
-            expr = sum(terms)
+            expr = cp_model.LinearExpr.Sum(terms)
         if operator == "<=":
             ct = self.model.Add(expr <= rhs)
         elif operator == ">=":
@@ -54,29 +120,63 @@ class CPSatBackend:
         if name:
             ct.WithName(name)
 
-    def add_weighted_sum(self, terms, weight: float, name: str) -> None:
-        if not terms or weight == 0:
+    def add_weighted_sum(self, variables, coefficients, weight: float, name: str) -> None:
+        """Add ``weight * sum(coefficients[i] * variables[i])`` to the objective."""
+
+        if not ObjectiveTerm.is_enabled(weight) or not variables:
             return
-        expr = sum(coeff * var for var, coeff in terms)
-        self._objective_terms.append((expr, weight))
+        # One WeightedSum per term keeps the expression building on the C++ side.
+        scaled = [coeff * weight for coeff in coefficients]
+        self._objective_terms.append(cp_model.LinearExpr.WeightedSum(variables, scaled))
+
+    def assignment_values(self, solver: cp_model.CpSolver) -> np.ndarray:
+        """Return the assignment variables' values as a boolean ``(employees, slots)`` matrix.
+
+        Values are read from the solver response in one call rather than one ``solver.Value`` per
+        variable. Without a solution every cell is ``False``.
+        """
+
+        shape = (len(self._var_matrix), len(self.slots))
+        solution = solver.response_proto.solution
+        if not solution or not self._var_matrix or not self.slots:
+            return np.zeros(shape, dtype=bool)
+        # The variables are created first and row by row, so their model indices are contiguous.
+        first = self._var_matrix[0][0].Index()
+        values = np.fromiter(solution, dtype=np.int64, count=len(solution))
+        return values[first : first + shape[0] * shape[1]].reshape(shape).astype(bool)
 
     def has_objective(self) -> bool:
         return bool(self._objective_terms)
 
-    def solve(self, time_limit_seconds: int | None = None, num_workers: int | None = None, log_search: bool = False) -> SolverResult:
+    def solve(
+        self,
+        time_limit_seconds: int | None = None,
+        num_workers: int | None = None,
+        log_search: bool = False,
+        *,
+        interleave_search: bool = True,
+        share_binary_clauses: bool = True,
+    ) -> SolverResult:
         if self._objective_terms:
-            objective = sum(weight * expr for expr, weight in self._objective_terms)
-            self.model.Maximize(objective)
+            self.model.Maximize(cp_model.LinearExpr.Sum(self._objective_terms))
 
         solver = cp_model.CpSolver()
         if time_limit_seconds is not None:
             solver.parameters.max_time_in_seconds = time_limit_seconds
-        if num_workers is not None:
-            solver.parameters.num_search_workers = num_workers
+        if num_workers is not None and num_workers > MAX_SEARCH_WORKERS:
+            logger.warning(
+                "Requested %d CP-SAT workers; capping at %d to avoid slower portfolio search.",
+                num_workers,
+                MAX_SEARCH_WORKERS,
+            )
+        workers = min(num_workers or MAX_SEARCH_WORKERS, MAX_SEARCH_WORKERS)
+        solver.parameters.num_search_workers = workers
+        solver.parameters.interleave_search = interleave_search
+        solver.parameters.share_binary_clauses = share_binary_clauses
         solver.parameters.log_search_progress = log_search
 
         status = solver.Solve(self.model)
-        return SolverResult(status=status, solver=solver)
+        return SolverResult(status=status, solver=solver, num_workers=workers)
 
 
-__all__ = ["CPSatBackend", "SolverResult"]
+__all__ = ["CPSatBackend", "MAX_SEARCH_WORKERS", "SolverResult"]
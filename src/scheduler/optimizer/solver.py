@@ -1,20 +1,22 @@
 """Solver orchestration for the scheduling engine."""
 from __future__ import annotations
 
-from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Iterable, List
+from typing import List, Sequence
 
+import numpy as np
 from ortools.sat.python import cp_model
 
 from scheduler import reporting
 from scheduler.config import AppConfig, resolve_paths
-from scheduler.constraints import CoverageConstraint, DailyLimitConstraint, MaxHoursConstraint, RestPeriodConstraint
-from scheduler.data_models import AssignmentDecision, ScheduleSolution, SchedulingInputs, SolverStatus
+from scheduler.constraints import Constraint, CoverageConstraint, DailyLimitConstraint, MaxHoursConstraint, RestPeriodConstraint
+from scheduler.data_models import ScheduleSolution, SchedulingInputs, SolverStatus
 from scheduler.io.excel_loader import ExcelDataLoader
-from scheduler.objective import OvertimePenalty, PreferenceSatisfaction, WeekendDistribution
-from scheduler.optimizer.backend import CPSatBackend
-from scheduler.time_index import TimeIndexer, TimeSlot
+from scheduler.objective import ObjectiveTerm, OvertimePenalty, PreferenceSatisfaction, WeekendDistribution
+from scheduler.objective.base import BackendProtocol
+from scheduler.optimizer.backend import CPSatBackend, SolverResult
+from scheduler.time_index import SlotTable, TimeIndexer, TimeSlot
 
 
 class SolverOrchestrator:
@@ -27,83 +29,229 @@ class SolverOrchestrator:
         loader = ExcelDataLoader(self.config.files.workbook_path)
         return loader.load()
 
-    def build_time_slots(self, inputs: SchedulingInputs) -> List[TimeSlot]:  # noqa: ARG002
-        start = datetime.fromisoformat(self.config.time.start_date)
-        end = datetime.fromisoformat(self.config.time.end_date)
-        indexer = TimeIndexer(start=start, end=end, slot_minutes=self.config.time.slot_minutes)
-        return indexer.build()
+    @cached_property
+    def indexer(self) -> TimeIndexer:
+        """Time indexer for the configured horizon, shared by every pass over this orchestrator."""
 
-    def register_constraints(self, backend: CPSatBackend, inputs: SchedulingInputs, slots: Iterable[TimeSlot]) -> List[str]:
-        applied: List[str] = []
+        time = self.config.time
+        return TimeIndexer(start=time.parsed_start, end=time.parsed_end, slot_minutes=time.slot_minutes)
+
+    def build_time_slots(self, inputs: SchedulingInputs) -> Sequence[TimeSlot]:  # noqa: ARG002
+        return tuple(self.indexer.build())
+
+    def enabled_constraints(self) -> List[Constraint]:
         toggles = self.config.toggles
+        constraints: List[Constraint] = []
         if toggles.enforce_coverage:
-            CoverageConstraint().apply(backend, inputs, slots)
-            applied.append("coverage")
+            constraints.append(CoverageConstraint())
         if toggles.enforce_max_hours:
-            MaxHoursConstraint().apply(backend, inputs, slots)
-            applied.append("max_hours")
+            constraints.append(MaxHoursConstraint())
         if toggles.enforce_daily_limits:
-            DailyLimitConstraint().apply(backend, inputs, slots)
-            applied.append("daily_limit")
+            constraints.append(DailyLimitConstraint())
         if toggles.enforce_rest_periods:
-            RestPeriodConstraint(min_rest_slots=1).apply(backend, inputs, slots)
-            applied.append("rest_period")
+            constraints.append(RestPeriodConstraint(min_rest_slots=1))
+        return constraints
+
+    def register_constraints(self, backend: CPSatBackend, inputs: SchedulingInputs, slots: SlotTable) -> List[str]:
+        applied: List[str] = []
+        for constraint in self.enabled_constraints():
+            constraint.apply(backend, inputs, slots)
+            applied.append(constraint.name)
         return applied
 
-    def register_objective(self, backend: CPSatBackend, inputs: SchedulingInputs, slots: Iterable[TimeSlot]) -> List[str]:
+    def register_objective(
+        self, backend: BackendProtocol, inputs: SchedulingInputs, slots: Sequence[TimeSlot]
+    ) -> List[str]:
         weights = self.config.objective
         applied: List[str] = []
-        if weights.honor_preferences:
+        if ObjectiveTerm.is_enabled(weights.honor_preferences):
             PreferenceSatisfaction(weights.honor_preferences).apply(backend, inputs, slots)
             applied.append("preferences")
-        if weights.distribute_weekends and self.config.toggles.balance_weekend_shifts:
+        balance_weekends = self.config.toggles.balance_weekend_shifts
+        if ObjectiveTerm.is_enabled(weights.distribute_weekends) and balance_weekends:
             WeekendDistribution(weights.distribute_weekends).apply(backend, inputs, slots)
             applied.append("weekend_distribution")
-        if weights.minimize_overtime:
+        if ObjectiveTerm.is_enabled(weights.minimize_overtime):
             OvertimePenalty(weights.minimize_overtime).apply(backend, inputs, slots)
             applied.append("overtime")
         return applied
 
     def solve(self) -> ScheduleSolution:
+        if self.config.solver.lazy_constraints:
+            return self.solve_lazy()
+
+        inputs = self.load_inputs()
+        slots = self.build_time_slots(inputs)
+        backend = CPSatBackend(inputs, slots, fast_build=self.config.solver.fast_build)
+        self.register_constraints(backend, inputs, backend.slot_soa)
+        self.register_objective(backend, inputs, slots)
+        return self._finish(inputs, slots, backend, self._run_backend(backend))
+
+    def solve_lazy(self, max_rounds: int = 10) -> ScheduleSolution:
+        """Solve with the workload constraints added only where an incumbent violates them.
+
+        Coverage is part of the model from the start. After each solve, the max-hours,
+        daily-limit and rest-period rows are checked against the solution and only the violated
+        ones are added before solving again. If rows are still being added after ``max_rounds``
+        solves, the constraints are added in full so the returned schedule is always valid.
+        """
+
         inputs = self.load_inputs()
         slots = self.build_time_slots(inputs)
-        backend = CPSatBackend(inputs, slots)
-        self.register_constraints(backend, inputs, slots)
+        backend = CPSatBackend(inputs, slots, fast_build=self.config.solver.fast_build)
+        constraints = self.enabled_constraints()
+        lazy = [constraint for constraint in constraints if not isinstance(constraint, CoverageConstraint)]
+        for constraint in constraints:
+            if constraint not in lazy:
+                constraint.apply(backend, inputs, backend.slot_soa)
         self.register_objective(backend, inputs, slots)
 
-        solver_result = backend.solve(
-            time_limit_seconds=self.config.solver.time_limit_seconds,
-            num_workers=self.config.solver.num_workers,
-            log_search=self.config.solver.log_search_progress,
+        for _ in range(max_rounds):
+            solver_result = self._run_backend(backend)
+            if solver_result.status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+                break
+            separator = _ViolatedRowSeparator(backend, solver_result.solver)
+            for constraint in lazy:
+                constraint.apply(separator, inputs, backend.slot_soa)
+            if not separator.added:
+                break
+        else:
+            for constraint in lazy:
+                constraint.apply(backend, inputs, backend.slot_soa)
+            solver_result = self._run_backend(backend)
+        return self._finish(inputs, slots, backend, solver_result)
+
+    def solve_sharded(self, shard_days: int = 7, overlap_slots: int = 1) -> ScheduleSolution:
+        """Solve the horizon as consecutive shards of ``shard_days`` calendar days and stitch them.
+
+        Shards are cut at midnight, so no day is split between two models. They are solved in
+        order: each shard also contains the last ``overlap_slots`` slots of the previous one with
+        their assignments fixed, which carries rest periods across the cut, and each employee's
+        hour budget is reduced by the hours already assigned. The time limit is split evenly
+        between shards, and the stitched schedule is scored against the full objective.
+        """
+
+        if shard_days < 1:
+            raise ValueError("shard_days must be at least 1")
+        inputs = self.load_inputs()
+        slots = self.build_time_slots(inputs)
+        table = SlotTable.from_slots(slots)
+        if not len(table):
+            # Nothing to shard; solve the empty model exactly as ``solve`` would.
+            backend = CPSatBackend(inputs, slots, fast_build=self.config.solver.fast_build)
+            return self._finish(inputs, slots, backend, self._run_backend(backend))
+        employees = inputs.employees
+        values = np.zeros((len(employees), len(table)), dtype=bool)
+
+        shard_of = (table.day - table.day[0]).astype(np.int64) // shard_days
+        cuts = (np.flatnonzero(np.diff(shard_of)) + 1).tolist()
+        shards = list(zip([0, *cuts], [*cuts, len(table)]))
+        time_limit = self.config.solver.time_limit_seconds
+        shard_time_limit = max(1, time_limit // len(shards)) if time_limit is not None else None
+
+        status = SolverStatus.optimal
+        for first, stop in shards:
+            lo = max(0, first - overlap_slots)
+            shard_slots = table.slots[lo:stop]
+            committed_minutes = values[:, :lo].astype(np.int64) @ table.duration_minutes[:lo]
+            shard_inputs = self._shard_inputs(inputs, shard_slots, committed_minutes.tolist())
+            backend = CPSatBackend(shard_inputs, shard_slots, fast_build=self.config.solver.fast_build)
+            self.register_constraints(backend, shard_inputs, backend.slot_soa)
+            for employee_pos, employee in enumerate(employees):
+                for pos in range(lo, first):
+                    slot_index = table.slots[pos].index
+                    backend.add_constraint(
+                        [backend.get_variable(employee.id, slot_index)],
+                        "==",
+                        int(values[employee_pos, pos]),
+                        name=f"handshake_{employee.id}_{slot_index}",
+                    )
+            self.register_objective(backend, shard_inputs, shard_slots)
+            solver_result = self._run_backend(backend, time_limit_seconds=shard_time_limit)
+            shard_status = self._translate_status(solver_result.status)
+            if shard_status not in (SolverStatus.optimal, SolverStatus.feasible):
+                status = shard_status
+                break
+            if shard_status is SolverStatus.feasible:
+                status = SolverStatus.feasible
+            values[:, first:stop] = backend.assignment_values(solver_result.solver)[:, first - lo :]
+
+        objective_value = None
+        if status in (SolverStatus.optimal, SolverStatus.feasible):
+            evaluator = _ObjectiveEvaluator(inputs, table, values)
+            self.register_objective(evaluator, inputs, table.slots)
+            objective_value = evaluator.value if evaluator.has_terms else None
+        solution = ScheduleSolution.from_values(
+            status, objective_value, values, [employee.id for employee in employees], table.slots
+        )
+        solution.statistics.update(reporting.generate_kpis(inputs, slots, solution, slot_table=table))
+        solution.statistics["num_workers"] = float(solver_result.num_workers)
+        return solution
+
+    @staticmethod
+    def _shard_inputs(
+        inputs: SchedulingInputs, shard_slots: Sequence[TimeSlot], committed_minutes: List[int]
+    ) -> SchedulingInputs:
+        start, end = shard_slots[0].start, shard_slots[-1].end
+        employees = [
+            employee.model_copy(update={"max_hours_per_week": max(employee.max_hours_per_week - used / 60, 0.0)})
+            for employee, used in zip(inputs.employees, committed_minutes)
+        ]
+        return inputs.model_copy(
+            update={
+                "employees": employees,
+                "availability": [block for block in inputs.availability if block.start < end and start < block.end],
+                "demand": [demand for demand in inputs.demand if demand.start < end and start < demand.end],
+            }
+        )
+
+    def _run_backend(self, backend: CPSatBackend, time_limit_seconds: int | None = None) -> SolverResult:
+        settings = self.config.solver
+        if time_limit_seconds is None:
+            time_limit_seconds = settings.time_limit_seconds
+        return backend.solve(
+            time_limit_seconds=time_limit_seconds,
+            num_workers=settings.num_workers,
+            log_search=settings.log_search_progress,
+            interleave_search=settings.interleave_search,
+            share_binary_clauses=settings.share_binary_clauses,
         )
+
+    def _finish(
+        self,
+        inputs: SchedulingInputs,
+        slots: Sequence[TimeSlot],
+        backend: CPSatBackend,
+        solver_result: SolverResult,
+    ) -> ScheduleSolution:
         solution = self._build_solution(inputs, slots, backend, solver_result)
-        solution.statistics.update(reporting.generate_kpis(inputs, slots, solution))
+        solution.statistics.update(
+            reporting.generate_kpis(
+                inputs,
+                slots,
+                solution,
+                slot_table=backend.slot_soa,
+            )
+        )
+        solution.statistics["num_workers"] = float(solver_result.num_workers)
         return solution
 
     def _build_solution(
         self,
         inputs: SchedulingInputs,
-        slots: Iterable[TimeSlot],
+        slots: Sequence[TimeSlot],
         backend: CPSatBackend,
         solver_result,
     ) -> ScheduleSolution:
-        status = self._translate_status(solver_result.status)
-        assignments: List[AssignmentDecision] = []
         solver = solver_result.solver
-        for employee in inputs.employees:
-            for slot in slots:
-                var = backend.get_variable(employee.id, slot.index)
-                assignments.append(
-                    AssignmentDecision(
-                        employee_id=employee.id,
-                        slot_index=slot.index,
-                        start=slot.start,
-                        end=slot.end,
-                        is_assigned=bool(solver.Value(var)),
-                    )
-                )
         objective_value = solver.ObjectiveValue() if backend.has_objective() else None
-        return ScheduleSolution(status=status, objective_value=objective_value, assignments=assignments)
+        return ScheduleSolution.from_values(
+            self._translate_status(solver_result.status),
+            objective_value,
+            backend.assignment_values(solver),
+            backend.employee_ids,
+            backend.slots,
+        )
 
     @staticmethod
     def _translate_status(status: int) -> SolverStatus:
@@ -116,4 +264,64 @@ class SolverOrchestrator:
         return mapping.get(status, SolverStatus.unknown)
 
 
+class _ObjectiveEvaluator:
+    """Objective backend that scores a fixed assignment matrix instead of building a model."""
+
+    def __init__(self, inputs: SchedulingInputs, slot_table: SlotTable, values: np.ndarray) -> None:
+        self.slot_soa = slot_table
+        self.duration_hours = slot_table.duration_hours
+        self.availability_by_pref = inputs.availability_by_preference()
+        self.weekend_slot_indices = tuple(slot_table.indices[slot_table.weekday >= 5].tolist())
+        self._employee_pos = {employee.id: pos for pos, employee in enumerate(inputs.employees)}
+        self._slot_pos = {index: pos for pos, index in enumerate(slot_table.indices.tolist())}
+        self._values = values
+        self.value = 0.0
+        self.has_terms = False
+
+    def get_variable(self, employee_id: str, slot_index: int) -> int:
+        return int(self._values[self._employee_pos[employee_id], self._slot_pos[slot_index]])
+
+    def variables_for(self, employee_id: str) -> List[int]:
+        return self._values[self._employee_pos[employee_id]].astype(np.int64).tolist()
+
+    def add_weighted_sum(self, variables, coefficients, weight: float, name: str) -> None:
+        if not ObjectiveTerm.is_enabled(weight) or not variables:
+            return
+        self.has_terms = True
+        self.value += weight * sum(value * coeff for value, coeff in zip(variables, coefficients))
+
+
+class _ViolatedRowSeparator:
+    """Constraint backend that forwards only the rows an incumbent solution violates."""
+
+    def __init__(self, backend: CPSatBackend, solver: cp_model.CpSolver) -> None:
+        self._backend = backend
+        solution = solver.response_proto.solution
+        self._values = np.fromiter(solution, dtype=np.int64, count=len(solution))
+        self.added = 0
+
+    def get_variable(self, employee_id: str, slot_index: int) -> cp_model.IntVar:
+        return self._backend.get_variable(employee_id, slot_index)
+
+    def add_constraint(self, terms, operator: str, rhs: float, name: str | None = None) -> None:
+        if not terms:
+            return
+        values = self._values
+        if isinstance(terms[0], tuple):
+            lhs = sum(values[var.Index()] * coeff for var, coeff in terms)
+        else:
+            lhs = sum(values[var.Index()] for var in terms)
+        if operator == "<=":
+            satisfied = lhs <= rhs
+        elif operator == ">=":
+            satisfied = lhs >= rhs
+        elif operator == "==":
+            satisfied = lhs == rhs
+        else:
+            raise ValueError(f"Unsupported operator: {operator}")
+        if not satisfied:
+            self._backend.add_constraint(terms, operator, rhs, name=name)
+            self.added += 1
+
+
 __all__ = ["SolverOrchestrator"]
@@ -1,82 +1,144 @@
 """Reporting helpers for solver results."""
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Dict, Iterable
+from typing import TYPE_CHECKING, Dict, Iterator, Sequence, Tuple
 
 from rich.console import Console
 from rich.table import Table
 
 from scheduler.config import AppConfig
 from scheduler.data_models import ScheduleSolution, SchedulingInputs
-from scheduler.time_index import TimeSlot
 
+# NumPy and the slot table are imported inside the KPI and rendering helpers so that importing
+# this module from the CLI (e.g. ``scheduler explain``) does not load NumPy.
+if TYPE_CHECKING:
+    import numpy as np
 
-def _slot_demand_map(inputs: SchedulingInputs, slots: Iterable[TimeSlot]) -> Dict[int, int]:
-    demand_map: Dict[int, int] = defaultdict(int)
-    slot_list = list(slots)
-    for demand in inputs.demand:
-        for slot in slot_list:
-            if slot.start < demand.end and demand.start < slot.end:
-                demand_map[slot.index] = max(demand_map[slot.index], demand.required_staff)
-    return demand_map
-
-
-def generate_kpis(inputs: SchedulingInputs, slots: Iterable[TimeSlot], solution: ScheduleSolution) -> Dict[str, float]:
-    slot_list = list(slots)
-    demand_map = _slot_demand_map(inputs, slot_list)
-    slot_index_map = {slot.index: slot for slot in slot_list}
-    coverage_met = 0
-    coverage_slots = 0
-    total_assignments = 0
-    sunday_assignments = 0
-    weekend_assignments = 0
-    total_hours = 0.0
-
-    assigned_by_slot: Dict[int, int] = defaultdict(int)
-    for decision in solution.assignments:
-        if not decision.is_assigned:
-            continue
-        assigned_by_slot[decision.slot_index] += 1
-        total_assignments += 1
-        slot = slot_index_map.get(decision.slot_index)
-        if slot is None:
-            continue
-        total_hours += (slot.end - slot.start).total_seconds() / 3600
-        if slot.start.weekday() == 6:
-            sunday_assignments += 1
-        if slot.start.weekday() >= 5:
-            weekend_assignments += 1
-
-    for slot in slot_list:
-        required = demand_map.get(slot.index)
-        if required is None or required <= 0:
-            continue
-        coverage_slots += 1
-        if assigned_by_slot.get(slot.index, 0) >= required:
-            coverage_met += 1
-
-    coverage_ratio = coverage_met / coverage_slots if coverage_slots else 1.0
+    from scheduler.time_index import SlotTable, TimeSlot
+
+
+def _slot_demand_map(inputs: SchedulingInputs, slots: SlotTable) -> np.ndarray:
+    """Return the required staff per slot, aligned with the rows of ``slots``.
+
+    Slots are sorted and do not overlap, so each demand window maps to one contiguous run of
+    rows located by binary search instead of testing every slot.
+    """
 
+    import numpy as np
+
+    required = np.zeros(len(slots), dtype=np.int32)
+    for demand in inputs.demand:
+        demand_start, demand_end = slots.as_wall_clock((demand.start, demand.end))
+        lo = int(np.searchsorted(slots.end, demand_start, side="right"))
+        hi = int(np.searchsorted(slots.start, demand_end, side="left"))
+        if lo < hi:
+            np.maximum(required[lo:hi], demand.required_staff, out=required[lo:hi])
+    return required
+
+
+def _kpis_kernel(
+    assigned_per_slot: np.ndarray,
+    weekday: np.ndarray,
+    duration_hours: np.ndarray,
+    required: np.ndarray,
+) -> Dict[str, float]:
+    """Reduce per-slot columns to the KPI dict; every input is aligned with the slot rows."""
+
+    coverage_mask = required > 0
+    coverage_slots = int(coverage_mask.sum())
+    coverage_met = int(((assigned_per_slot >= required) & coverage_mask).sum())
     return {
         "coverage_slots": float(coverage_slots),
-        "coverage_met_ratio": coverage_ratio,
-        "total_assignments": float(total_assignments),
-        "total_assigned_hours": total_hours,
-        "weekend_assignments": float(weekend_assignments),
-        "sunday_assignments": float(sunday_assignments),
+        "coverage_met_ratio": coverage_met / coverage_slots if coverage_slots else 1.0,
+        "total_assignments": float(assigned_per_slot.sum()),
+        "total_assigned_hours": float(assigned_per_slot @ duration_hours),
+        "weekend_assignments": float(assigned_per_slot[weekday >= 5].sum()),
+        "sunday_assignments": float(assigned_per_slot[weekday == 6].sum()),
     }
 
 
-def render_solution_table(solution: ScheduleSolution) -> Table:
-    table = Table(title=f"Schedule Solution ({solution.status.value})", show_lines=False)
+def generate_kpis(
+    inputs: SchedulingInputs,
+    slots: Sequence[TimeSlot],
+    solution: ScheduleSolution,
+    *,
+    slot_table: SlotTable | None = None,
+) -> Dict[str, float]:
+    """Summarise coverage and workload KPIs.
+
+    Pass the backend's ``slot_soa`` table to reuse it; its rows must line up with the columns of
+    ``solution.assignment_values`` when the solution carries that matrix.
+    """
+
+    import numpy as np
+
+    from scheduler.time_index import SlotTable
+
+    if slot_table is None:
+        slot_table = SlotTable.from_slots(slots)
+    required = _slot_demand_map(inputs, slot_table)
+
+    values = solution.assignment_values
+    if values is not None:
+        assigned_per_slot = values.sum(axis=0, dtype=np.int64)
+    else:
+        row_of = {index: row for row, index in enumerate(slot_table.indices.tolist())}
+        rows = [
+            row_of[decision.slot_index]
+            for decision in solution.assignments
+            if decision.is_assigned and decision.slot_index in row_of
+        ]
+        assigned_per_slot = np.bincount(np.asarray(rows, dtype=np.int64), minlength=len(slot_table))
+
+    return _kpis_kernel(assigned_per_slot, slot_table.weekday, slot_table.duration_hours, required)
+
+
+def _assignment_rows(solution: ScheduleSolution) -> Iterator[Tuple[str, str, str, str]]:
+    """Yield ``(employee, slot, start, end)`` cells for every assigned decision."""
+
+    values = solution.assignment_values
+    axes = solution.assignment_axes
+    if values is None or axes is None:
+        for decision in solution.assignments:
+            if decision.is_assigned:
+                start, end = str(decision.start), str(decision.end)
+                yield decision.employee_id, str(decision.slot_index), start, end
+        return
+    import numpy as np
+
+    # Labels are formatted once per slot and only the set cells of the matrix are visited.
+    employee_ids, slots = axes
+    slot_cells = [(str(slot.index), str(slot.start), str(slot.end)) for slot in slots]
+    for employee_pos, slot_pos in np.argwhere(values).tolist():
+        yield (employee_ids[employee_pos], *slot_cells[slot_pos])
+
+
+def _solution_table(title: str) -> Table:
+    table = Table(title=title, show_lines=False, box=None)
     table.add_column("Employee")
     table.add_column("Slot")
     table.add_column("Start")
     table.add_column("End")
-    for decision in solution.assignments:
-        if decision.is_assigned:
-            table.add_row(decision.employee_id, str(decision.slot_index), str(decision.start), str(decision.end))
+    return table
+
+
+def iter_solution_tables(solution: ScheduleSolution, page_size: int = 1000) -> Iterator[Table]:
+    """Yield the schedule as tables of at most ``page_size`` rows each."""
+
+    title = f"Schedule Solution ({solution.status.value})"
+    table = _solution_table(title)
+    for row in _assignment_rows(solution):
+        if table.row_count == page_size:
+            yield table
+            table = _solution_table(f"{title} (continued)")
+        table.add_row(*row)
+    yield table
+
+
+def render_solution_table(solution: ScheduleSolution) -> Table:
+    table = _solution_table(f"Schedule Solution ({solution.status.value})")
+    for row in _assignment_rows(solution):
+        table.add_row(*row)
     return table
 
 
@@ -97,8 +159,8 @@ def explain_configuration(config: AppConfig) -> str:
 
 def print_report(solution: ScheduleSolution) -> None:
     console = Console()
-    table = render_solution_table(solution)
-    console.print(table)
+    for table in iter_solution_tables(solution):
+        console.print(table)
     if solution.statistics:
         stats_table = Table(title="KPIs")
         stats_table.add_column("Metric")
@@ -108,4 +170,10 @@ def print_report(solution: ScheduleSolution) -> None:
         console.print(stats_table)
 
 
-__all__ = ["explain_configuration", "generate_kpis", "print_report", "render_solution_table"]
+__all__ = [
+    "explain_configuration",
+    "generate_kpis",
+    "iter_solution_tables",
+    "print_report",
+    "render_solution_table",
+]
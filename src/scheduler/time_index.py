@@ -2,10 +2,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Dict, Iterable, List, Sequence
+from datetime import datetime, timedelta, tzinfo
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Iterable, List, Sequence, Tuple
 
-import pandas as pd
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass(frozen=True)
@@ -16,13 +20,88 @@ class TimeSlot:
     start: datetime
     end: datetime
 
-    @property
+    @cached_property
     def duration_hours(self) -> float:
         return (self.end - self.start).total_seconds() / 3600
 
 
+def wall_clock_datetime64(moments: Iterable[datetime], tz: tzinfo | None = None) -> np.ndarray:
+    """Return ``moments`` as ``datetime64[us]`` wall-clock values, dropping any tzinfo.
+
+    NumPy would convert aware datetimes to UTC; keeping the local reading matches how
+    :class:`TimeIndexer` builds slots, so days and weekdays stay those of the horizon. When
+    ``tz`` is given, aware moments are first converted to it, so instants recorded with another
+    offset land on the horizon's clock instead of being read at face value.
+    """
+
+    if tz is None:
+        return np.array([moment.replace(tzinfo=None) for moment in moments], dtype="datetime64[us]")
+    return np.array(
+        [
+            (moment if moment.tzinfo is None else moment.astimezone(tz)).replace(tzinfo=None)
+            for moment in moments
+        ],
+        dtype="datetime64[us]",
+    )
+
+
+@dataclass(frozen=True)
+class SlotTable:
+    """Column-oriented view of the time slots, built once and shared by all constraints.
+
+    Slots are stored in start order. Times are wall-clock ``datetime64[us]`` values: aware
+    datetimes keep their local reading rather than being converted to UTC.
+    """
+
+    slots: Tuple[TimeSlot, ...]
+    indices: np.ndarray
+    start: np.ndarray
+    end: np.ndarray
+    duration_minutes: np.ndarray
+    duration_hours: np.ndarray
+    day: np.ndarray
+    weekday: np.ndarray
+
+    @classmethod
+    def from_slots(cls, slots: Iterable[TimeSlot]) -> "SlotTable":
+        ordered = tuple(sorted(slots, key=lambda slot: slot.start))
+        start = wall_clock_datetime64(slot.start for slot in ordered)
+        end = wall_clock_datetime64(slot.end for slot in ordered)
+        duration_minutes = np.rint((end - start) / np.timedelta64(1, "m")).astype(np.int64)
+        day = start.astype("datetime64[D]")
+        return cls(
+            slots=ordered,
+            indices=np.array([slot.index for slot in ordered], dtype=np.int64),
+            start=start,
+            end=end,
+            duration_minutes=duration_minutes,
+            duration_hours=(end - start) / np.timedelta64(1, "h"),
+            day=day,
+            # 1970-01-01 was a Thursday, i.e. ``weekday() == 3``.
+            weekday=((day.astype(np.int64) + 3) % 7).astype(np.int8),
+        )
+
+    @property
+    def horizon_tz(self) -> tzinfo | None:
+        """Timezone of the slot times, or ``None`` for a naive horizon."""
+
+        return self.slots[0].start.tzinfo if self.slots else None
+
+    def as_wall_clock(self, moments: Iterable[datetime]) -> np.ndarray:
+        """Return ``moments`` on this table's wall clock, comparable with ``start``/``end``."""
+
+        return wall_clock_datetime64(moments, self.horizon_tz)
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+
 class TimeIndexer:
-    """Build time slots for the planning horizon."""
+    """Build time slots for the planning horizon.
+
+    Slot boundaries are computed as NumPy ``datetime64`` columns in one vectorised step; the
+    ``TimeSlot`` objects returned by :meth:`build` are only created on first request.
+    """
 
     def __init__(self, start: datetime, end: datetime, slot_minutes: int) -> None:
         if end <= start:
@@ -30,36 +109,67 @@ class TimeIndexer:
         self.start = start
         self.end = end
         self.slot_minutes = slot_minutes
+        self._delta = timedelta(minutes=slot_minutes)
         self._slots: List[TimeSlot] = []
+        self._arrays: Tuple[np.ndarray, np.ndarray] | None = None
+
+    def _build_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the wall-clock ``(starts, ends)`` columns, computing them on first call."""
+
+        if self._arrays is not None:
+            return self._arrays
+        # Arithmetic runs on wall-clock values; aware datetimes get their tzinfo back when the
+        # TimeSlot objects are materialised, exactly as repeated ``cursor + delta`` would.
+        delta = np.timedelta64(self.slot_minutes, "m")
+        start = np.datetime64(self.start.replace(tzinfo=None), "us")
+        end = np.datetime64(self.end.replace(tzinfo=None), "us")
+        count = int(-(-(end - start) // delta))
+        starts = start + np.arange(count) * delta
+        self._arrays = (starts, np.minimum(starts + delta, end))
+        return self._arrays
 
     def build(self) -> List[TimeSlot]:
         if self._slots:
             return self._slots
 
-        delta = timedelta(minutes=self.slot_minutes)
-        index = 0
-        cursor = self.start
-        while cursor < self.end:
-            slot_end = min(cursor + delta, self.end)
-            self._slots.append(TimeSlot(index=index, start=cursor, end=slot_end))
-            index += 1
-            cursor = slot_end
+        start_array, end_array = self._build_arrays()
+        # ``datetime64[us]`` converts to naive datetimes.
+        starts: List[datetime] = start_array.tolist()
+        ends: List[datetime] = end_array.tolist()
+        tz = self.start.tzinfo
+        if tz is not None:
+            starts = [moment.replace(tzinfo=tz) for moment in starts]
+            ends = [moment.replace(tzinfo=tz) for moment in ends]
+        self._slots.extend(
+            TimeSlot(index=index, start=slot_start, end=slot_end)
+            for index, (slot_start, slot_end) in enumerate(zip(starts, ends))
+        )
         return self._slots
 
     def as_dataframe(self) -> pd.DataFrame:
-        return pd.DataFrame(
-            {
-                "index": [slot.index for slot in self.build()],
-                "start": [slot.start for slot in self.build()],
-                "end": [slot.end for slot in self.build()],
-            }
-        )
+        import pandas as pd
+
+        if self.start.tzinfo is not None:
+            slots = self.build()
+            return pd.DataFrame(
+                {
+                    "index": [slot.index for slot in slots],
+                    "start": [slot.start for slot in slots],
+                    "end": [slot.end for slot in slots],
+                }
+            )
+        starts, ends = self._build_arrays()
+        return pd.DataFrame({"index": np.arange(len(starts)), "start": starts, "end": ends})
+
+    def index_of(self, moment: datetime) -> int:
+        """Return the index of the slot containing ``moment`` by arithmetic on the slot length."""
+
+        if not self.start <= moment < self.end:
+            raise KeyError(moment)
+        return (moment - self.start) // self._delta
 
     def find_slot(self, moment: datetime) -> TimeSlot:
-        for slot in self.build():
-            if slot.start <= moment < slot.end:
-                return slot
-        raise KeyError(moment)
+        return self.build()[self.index_of(moment)]
 
 
-__all__ = ["TimeIndexer", "TimeSlot"]
+__all__ = ["SlotTable", "TimeIndexer", "TimeSlot", "wall_clock_datetime64"]
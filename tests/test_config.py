@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+
+def test_shift_by_id_maps_identifiers(basic_config):
+    assert set(basic_config.shift_by_id) == {"shift_1", "shift_2"}
+    assert basic_config.shift_by_id["shift_2"] is basic_config.shifts[1]
+
+
+def test_skill_bits_follow_current_skills(basic_config):
+    bits = basic_config.skill_bits()
+    assert sorted(bits) == ["back", "front"]
+    assert len(set(bits.values())) == 2 and all(bit & (bit - 1) == 0 for bit in bits.values())
+    basic_config.employees[1].skills.add("bar")
+    assert sorted(basic_config.skill_bits()) == ["back", "bar", "front"]
@@ -7,6 +7,7 @@ from modular_shift_scheduler.constraints import (
     hours_used_by_employee,
     max_hours_respected,
     no_overlaps,
+    overlapping_shifts_for_employee,
     shortage_for_shift,
 )
 from modular_shift_scheduler.time_index import TimeIndexer
@@ -14,10 +15,23 @@ from modular_shift_scheduler.time_index import TimeIndexer
 
 def test_assignment_candidates_filter_by_skill(basic_config):
     candidates = assignment_candidates(basic_config)
-    assert candidates["shift_1"] == ["alice", "bob"]
+    # Cheapest employee first: bob (12/h) before alice (15/h).
+    assert candidates["shift_1"] == ["bob", "alice"]
     assert candidates["shift_2"] == ["alice"]
 
 
+def test_assignment_candidates_follow_skill_changes_after_validate(basic_config):
+    basic_config.employees[1].skills.add("back")
+    assert assignment_candidates(basic_config)["shift_2"] == ["bob", "alice"]
+
+
+def test_assignment_candidates_prune_by_max_hours(basic_config):
+    indexer = TimeIndexer.from_shifts(basic_config.shifts, basic_config.slot_minutes)
+    basic_config.employees[1].max_hours_per_week = 3
+    candidates = assignment_candidates(basic_config, indexer)
+    assert candidates["shift_1"] == ["alice"]
+
+
 def test_shortage_for_shift_counts_missing_staff(basic_config):
     shift = basic_config.shifts[0]
     assert shortage_for_shift(shift, ["alice"]) == 0
@@ -48,3 +62,13 @@ def test_max_hours_and_overlap_constraints(basic_config):
     overlapping_config.shifts[1].start = overlapping_config.shifts[0].start
     overlapping_config.shifts[1].end = overlapping_config.shifts[0].end
     assert not no_overlaps(overlapping_assignments, overlapping_config)
+
+
+def test_overlapping_shifts_reports_non_adjacent_pairs(basic_config):
+    long_shift = copy.deepcopy(basic_config.shifts[0])
+    long_shift.identifier = "long"
+    long_shift.end = basic_config.shifts[1].end
+    lookup = {**basic_config.shift_by_id, "long": long_shift}
+    assignments = {"alice": ["shift_2", "shift_1", "long"]}
+    overlaps = overlapping_shifts_for_employee("alice", assignments, lookup)
+    assert sorted(overlaps) == [("long", "shift_2"), ("shift_1", "long")]
@@ -13,6 +13,14 @@ def test_load_config_from_excel_round_trip(excel_fixture_path):
     assert {shift.identifier for shift in config.shifts} == {"shift_1", "shift_2"}
 
 
+def test_cached_loads_return_independent_copies(excel_fixture_path):
+    first = load_config_from_excel(excel_fixture_path)
+    first.employees[0].max_hours_per_week = 1
+    second = load_config_from_excel(excel_fixture_path)
+    assert second.employees[0].max_hours_per_week == 20
+    assert second == load_config_from_excel(excel_fixture_path, use_cache=False)
+
+
 def test_missing_sheet_raises(tmp_path):
     broken = tmp_path / "broken.xlsx"
     write_workbook(
@@ -23,3 +31,25 @@ def test_missing_sheet_raises(tmp_path):
 
     with pytest.raises(ValueError):
         load_config_from_excel(broken)
+
+
+def test_rows_without_id_are_skipped(tmp_path):
+    path = tmp_path / "blank.xlsx"
+    write_workbook(
+        path,
+        employees_rows=[
+            ["id", "name", "skills", "max_hours_per_week"],
+            ["a", "A", "front", 10],
+            [None, "stray note"],
+            [],
+        ],
+        shifts_rows=[
+            ["id", "start", "end", "required_skill", "required_employees"],
+            ["s1", "2024-01-01T09:00:00", "2024-01-01T12:00:00", "front", 1],
+            [None, None, None, None, None],
+        ],
+    )
+
+    config = load_config_from_excel(path)
+    assert [emp.identifier for emp in config.employees] == ["a"]
+    assert [shift.identifier for shift in config.shifts] == ["s1"]
@@ -14,6 +14,14 @@ def test_labour_cost_uses_employee_rates(basic_config):
     assert cost == pytest.approx(expected)
 
 
+def test_labour_cost_accepts_precomputed_hours(basic_config):
+    indexer = TimeIndexer.from_shifts(basic_config.shifts, basic_config.slot_minutes)
+    assignments = {"alice": ["shift_1"], "bob": ["shift_1"]}
+    shift_hours = {"shift_1": 2.0, "shift_2": 4.0}
+    cost = labour_cost(assignments, basic_config, indexer, shift_hours)
+    assert cost == pytest.approx(15 * 2 + 12 * 2)
+
+
 def test_shortage_penalty_scales_with_weight(basic_config):
     shortages = {"shift_1": 0, "shift_2": 1}
     penalty = shortage_penalty(shortages, basic_config)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple
+
+import pytest
+
+pytest.importorskip("numpy")
+# ``exc_type`` also skips when the installed pydantic cannot import the package config.
+coverage = pytest.importorskip("scheduler.constraints.coverage", exc_type=ImportError)
+
+from scheduler import reporting  # noqa: E402
+from scheduler.data_models import Employee, SchedulingInputs, ShiftDemand  # noqa: E402
+from scheduler.time_index import SlotTable, TimeIndexer  # noqa: E402
+
+PLUS_ONE = timezone(timedelta(hours=1))
+
+
+class _RecordingBackend:
+    def __init__(self) -> None:
+        self.rows: List[Tuple[str, str, int]] = []
+
+    def get_variable(self, employee_id: str, slot_index: int):
+        return (employee_id, slot_index)
+
+    def add_constraint(self, terms, operator, rhs, name=None):
+        self.rows.append((name, operator, rhs))
+
+
+def test_coverage_compares_demand_instants_across_offsets():
+    start = datetime(2024, 1, 8, 8, tzinfo=PLUS_ONE)
+    table = SlotTable.from_slots(TimeIndexer(start, start + timedelta(hours=3), 60).build())
+    # 08:30Z-08:50Z is 09:30-09:50 on the horizon's clock, inside the 09:00+01:00 slot.
+    demand = ShiftDemand(
+        start=datetime(2024, 1, 8, 8, 30, tzinfo=timezone.utc),
+        end=datetime(2024, 1, 8, 8, 50, tzinfo=timezone.utc),
+        required_staff=2,
+    )
+    inputs = SchedulingInputs(
+        employees=[Employee(id="e0", name="E0", max_hours_per_week=40)], availability=[], demand=[demand]
+    )
+
+    backend = _RecordingBackend()
+    coverage.CoverageConstraint().apply(backend, inputs, table)
+    assert backend.rows == [("coverage_1", ">=", 2)]
+    assert reporting._slot_demand_map(inputs, table).tolist() == [0, 2, 0]
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Iterable, List
+
+import pytest
+
+pytest.importorskip("ortools")
+# ``exc_type`` also skips when the installed pydantic cannot import the package config.
+pytest.importorskip("scheduler.optimizer.solver", exc_type=ImportError)
+
+from scheduler import config as scheduler_config  # noqa: E402
+from scheduler.data_models import (  # noqa: E402
+    AvailabilityBlock,
+    Employee,
+    PreferenceLevel,
+    ScheduleSolution,
+    SchedulingInputs,
+    ShiftDemand,
+    SolverStatus,
+)
+from scheduler.optimizer import backend as scheduler_backend  # noqa: E402
+from scheduler.optimizer.solver import SolverOrchestrator  # noqa: E402
+from scheduler.time_index import SlotTable  # noqa: E402
+
+START = datetime(2024, 1, 5, 6)
+
+
+def _inputs(base_hours: float = 6) -> SchedulingInputs:
+    employees = [Employee(id=f"e{i}", name=f"E{i}", max_hours_per_week=base_hours + 2 * i) for i in range(4)]
+    availability = [
+        AvailabilityBlock(
+            employee_id="e0", start=START, end=START + timedelta(hours=10), preference=PreferenceLevel.preferred
+        ),
+        AvailabilityBlock(
+            employee_id="e1", start=START, end=START + timedelta(hours=4), preference=PreferenceLevel.unavailable
+        ),
+        AvailabilityBlock(
+            employee_id="e2",
+            start=START + timedelta(days=1),
+            end=START + timedelta(days=2),
+            preference=PreferenceLevel.preferred,
+        ),
+    ]
+    demand = [
+        ShiftDemand(start=START + timedelta(hours=2), end=START + timedelta(hours=6), required_staff=2),
+        ShiftDemand(start=START + timedelta(days=1, hours=3), end=START + timedelta(days=1, hours=5), required_staff=1),
+        ShiftDemand(start=START + timedelta(days=2, hours=4), end=START + timedelta(days=2, hours=7), required_staff=2),
+    ]
+    return SchedulingInputs(employees=employees, availability=availability, demand=demand)
+
+
+def _orchestrator(
+    inputs: SchedulingInputs, enforce_rest_periods: bool = True, **solver_settings
+) -> SolverOrchestrator:
+    config = scheduler_config.AppConfig(
+        time={"start_date": START.isoformat(), "end_date": (START + timedelta(days=2, hours=12)).isoformat(), "slot_minutes": 120},
+        files={"workbook_path": "unused.xlsx"},
+        toggles={"enforce_rest_periods": enforce_rest_periods, "balance_weekend_shifts": True},
+        solver={"num_workers": 1, **solver_settings},
+    )
+    orchestrator = SolverOrchestrator(config)
+    orchestrator.load_inputs = lambda: inputs  # type: ignore[method-assign]
+    return orchestrator
+
+
+class _RowChecker:
+    """Constraint backend that records the names of rows a solved schedule violates."""
+
+    def __init__(self, solution: ScheduleSolution) -> None:
+        assert solution.assignment_axes is not None and solution.assignment_values is not None
+        employee_ids, slots = solution.assignment_axes
+        self.slots = slots
+        self._values = solution.assignment_values
+        self._row = {employee_id: row for row, employee_id in enumerate(employee_ids)}
+        self._column = {slot.index: column for column, slot in enumerate(slots)}
+        self.violated: List[str] = []
+
+    def get_variable(self, employee_id: str, slot_index: int) -> int:
+        return int(self._values[self._row[employee_id], self._column[slot_index]])
+
+    def add_constraint(self, terms, operator: str, rhs: float, name: str | None = None) -> None:
+        if terms and isinstance(terms[0], tuple):
+            lhs = sum(value * coeff for value, coeff in terms)
+        else:
+            lhs = sum(terms)
+        if not {"<=": lhs <= rhs, ">=": lhs >= rhs, "==": lhs == rhs}[operator]:
+            self.violated.append(name or "")
+
+
+def _violated_rows(orchestrator: SolverOrchestrator, solution: ScheduleSolution) -> List[str]:
+    inputs = orchestrator.load_inputs()
+    checker = _RowChecker(solution)
+    table = SlotTable.from_slots(checker.slots)
+    for constraint in orchestrator.enabled_constraints():
+        constraint.apply(checker, inputs, table)
+    return checker.violated
+
+
+def _daily_demand(hour: int, required_staff: Iterable[int]) -> List[ShiftDemand]:
+    return [
+        ShiftDemand(
+            start=START.replace(hour=hour) + timedelta(days=day),
+            end=START.replace(hour=hour) + timedelta(days=day, hours=2),
+            required_staff=staff,
+        )
+        for day, staff in enumerate(required_staff)
+        if staff
+    ]
+
+
+def _unnamed_model(backend) -> str:
+    proto = backend.model.Proto()
+    for variable in proto.variables:
+        variable.name = ""
+    return str(proto)
+
+
+@pytest.mark.parametrize("proto_int_var", [True, False])
+def test_fast_build_matches_named_model(monkeypatch, proto_int_var):
+    if proto_int_var and not scheduler_backend._PROTO_INT_VAR:
+        pytest.skip("installed OR-Tools has no proto IntVar API")
+    monkeypatch.setattr(scheduler_backend, "_PROTO_INT_VAR", proto_int_var)
+    inputs = _inputs()
+    orchestrator = _orchestrator(inputs)
+    slots = orchestrator.build_time_slots(inputs)
+    backends = []
+    for fast_build in (False, True):
+        backend = scheduler_backend.CPSatBackend(inputs, slots, fast_build=fast_build)
+        orchestrator.register_constraints(backend, inputs, backend.slot_soa)
+        orchestrator.register_objective(backend, inputs, backend.slots)
+        backends.append(backend)
+    named, fast = backends
+    assert all(variable.name == "" for variable in fast.model.Proto().variables)
+    assert _unnamed_model(named) == _unnamed_model(fast)
+
+    results = [backend.solve(num_workers=1) for backend in backends]
+    assert results[0].status == results[1].status == scheduler_backend.cp_model.OPTIMAL
+    assert results[0].solver.ObjectiveValue() == pytest.approx(results[1].solver.ObjectiveValue())
+    assert (named.assignment_values(results[0].solver) == fast.assignment_values(results[1].solver)).all()
+
+
+def test_sharded_solve_matches_monolithic_objective():
+    # Hour budgets are loose and rest periods are off, so no constraint couples the days and
+    # solving one day at a time must reach the monolithic optimum.
+    orchestrator = _orchestrator(_inputs(base_hours=40), enforce_rest_periods=False)
+    monolithic = orchestrator.solve()
+    sharded = orchestrator.solve_sharded(shard_days=1)
+    assert monolithic.status == sharded.status == SolverStatus.optimal
+    assert sharded.objective_value == pytest.approx(monolithic.objective_value)
+    assert len(sharded.assignments) == int(sharded.assignment_values.sum())
+
+
+
+def test_sharded_solve_hands_rest_periods_across_the_cut():
+    # e0 and e1 must close Friday at 22:00 while e2 prefers the morning, so the rest period
+    # carried over the midnight cut leaves only e2 for the Saturday 00:00 slot.
+    employees = [Employee(id=f"e{i}", name=f"E{i}", max_hours_per_week=40) for i in range(3)]
+    availability = [
+        AvailabilityBlock(
+            employee_id="e2", start=START, end=START + timedelta(hours=4), preference=PreferenceLevel.preferred
+        )
+    ]
+    demand = [
+        ShiftDemand(start=START.replace(hour=22), end=START.replace(hour=22) + timedelta(hours=2), required_staff=2),
+        ShiftDemand(start=START + timedelta(hours=18), end=START + timedelta(hours=20), required_staff=1),
+    ]
+    orchestrator = _orchestrator(SchedulingInputs(employees=employees, availability=availability, demand=demand))
+    sharded = orchestrator.solve_sharded(shard_days=1, overlap_slots=1)
+
+    assert sharded.status in (SolverStatus.optimal, SolverStatus.feasible)
+    assert _violated_rows(orchestrator, sharded) == []
+    worked = {(decision.employee_id, decision.start) for decision in sharded.assignments}
+    assert {("e0", START.replace(hour=22)), ("e1", START.replace(hour=22))} <= worked
+    assert ("e2", START + timedelta(hours=18)) in worked
+
+
+def test_sharded_solve_carries_spent_hours_into_later_shards():
+    # The objective rewards every assigned hour, so e0 works each day until its 4h budget, shared
+    # across all three shards, is spent; e1 covers the rest.
+    employees = [
+        Employee(id="e0", name="E0", max_hours_per_week=4),
+        Employee(id="e1", name="E1", max_hours_per_week=40),
+    ]
+    inputs = SchedulingInputs(employees=employees, availability=[], demand=_daily_demand(8, [1, 1, 1]))
+    orchestrator = _orchestrator(inputs, enforce_rest_periods=False)
+    sharded = orchestrator.solve_sharded(shard_days=1)
+
+    assert sharded.status in (SolverStatus.optimal, SolverStatus.feasible)
+    assert _violated_rows(orchestrator, sharded) == []
+    assert sharded.assignment_axes is not None and sharded.assignment_values is not None
+    employee_ids, slots = sharded.assignment_axes
+    hours = sharded.assignment_values @ [slot.duration_hours for slot in slots]
+    assert dict(zip(employee_ids, hours.tolist())) == {"e0": 4.0, "e1": 6.0}
+
+
+def test_sharded_solve_of_empty_horizon_matches_solve():
+    orchestrator = _orchestrator(_inputs())
+    orchestrator.build_time_slots = lambda inputs: ()  # type: ignore[method-assign]
+    sharded = orchestrator.solve_sharded(shard_days=1)
+    monolithic = orchestrator.solve()
+    assert sharded.status == monolithic.status
+    assert sharded.assignments == monolithic.assignments == []
+
+
+def test_solve_lazy_matches_full_model_and_adds_violated_rows(monkeypatch):
+    orchestrator = _orchestrator(_inputs())
+    full = orchestrator.solve()
+
+    added_rows = []
+    add_constraint = scheduler_backend.CPSatBackend.add_constraint
+
+    def record_add_constraint(self, terms, operator, rhs, name=None):
+        added_rows.append(name)
+        add_constraint(self, terms, operator, rhs, name=name)
+
+    monkeypatch.setattr(scheduler_backend.CPSatBackend, "add_constraint", record_add_constraint)
+    lazy = orchestrator.solve_lazy()
+    assert lazy.status == full.status == SolverStatus.optimal
+    assert lazy.objective_value == pytest.approx(full.objective_value)
+    # The objective rewards assigned hours, so the first incumbent overruns the hour budgets.
+    max_hours_rows = [name for name in added_rows if name and name.startswith("max_hours_")]
+    assert 0 < len(max_hours_rows) <= len(orchestrator.load_inputs().employees)
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import warnings
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+np = pytest.importorskip("numpy")
+# ``exc_type`` also skips when the installed pydantic cannot import the package config.
+time_index = pytest.importorskip("scheduler.time_index", exc_type=ImportError)
+
+
+def test_slot_table_keeps_wall_clock_for_offset_horizon():
+    start = datetime(2024, 1, 6, tzinfo=timezone(timedelta(hours=2)))
+    slots = time_index.TimeIndexer(start, start + timedelta(hours=8), 120).build()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        table = time_index.SlotTable.from_slots(slots)
+    assert table.weekday.tolist() == [slot.start.weekday() for slot in slots] == [5, 5, 5, 5]
+    assert (table.day == np.datetime64("2024-01-06")).all()
+    assert table.start[0] == np.datetime64("2024-01-06T00:00")
+    assert table.duration_minutes.tolist() == [120, 120, 120, 120]
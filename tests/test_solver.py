@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from modular_shift_scheduler.solver import solve
 
 
@@ -12,3 +14,22 @@ def test_solver_produces_feasible_schedule(basic_config):
     assigned_pairs = set(result.assigned_pairs())
     assert ("alice", "shift_2") in assigned_pairs
     assert any(pair[1] == "shift_1" for pair in assigned_pairs)
+
+
+def test_cp_sat_matches_search_objective(basic_config):
+    pytest.importorskip("ortools")
+    cp_sat = solve(basic_config, method="cp_sat")
+    search = solve(basic_config, method="search")
+    assert cp_sat.status == "Optimal"
+    assert cp_sat.objective_value == pytest.approx(search.objective_value)
+    assert cp_sat.shortage_by_shift == search.shortage_by_shift
+
+
+def test_unknown_method_rejected(basic_config):
+    with pytest.raises(ValueError):
+        solve(basic_config, method="magic")
+
+
+def test_solve_records_shift_slots(basic_config):
+    solve(basic_config, method="search")
+    assert [(shift.start_slot, shift.end_slot) for shift in basic_config.shifts] == [(0, 4), (4, 8)]
@@ -16,3 +16,15 @@ def test_time_index_validation(basic_config):
     indexer = TimeIndexer.from_shifts(basic_config.shifts, basic_config.slot_minutes)
     with pytest.raises(ValueError):
         indexer.index(basic_config.shifts[0].start.replace(hour=10, minute=30))
+
+
+def test_from_shifts_rejects_misaligned_shift(basic_config):
+    basic_config.shifts[1].end = basic_config.shifts[1].end.replace(minute=45)
+    with pytest.raises(ValueError):
+        TimeIndexer.from_shifts(basic_config.shifts, basic_config.slot_minutes)
+
+
+def test_duration_for_shift_strict_matches_fast_path(basic_config):
+    indexer = TimeIndexer.from_shifts(basic_config.shifts, basic_config.slot_minutes)
+    for shift in basic_config.shifts:
+        assert indexer.duration_for_shift(shift) == indexer.duration_for_shift(shift, strict=True)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import zipfile
+
+import pytest
+
+from modular_shift_scheduler.excel_loader import load_config_from_excel
+from modular_shift_scheduler.xlsx_writer import write_workbook
+
+
+def test_write_workbook_escapes_text(tmp_path):
+    path = tmp_path / "escaped.xlsx"
+    write_workbook(
+        path,
+        employees_rows=[
+            ["id", "name", "skills", "max_hours_per_week", "cost_per_hour"],
+            ["a", "Ann & <Bo>", "front", 10, 12.5],
+        ],
+        shifts_rows=[
+            ["id", "start", "end", "required_skill", "required_employees"],
+            ["s1", "2024-01-01T09:00:00", "2024-01-01T12:00:00", "front", 1],
+        ],
+    )
+
+    config = load_config_from_excel(path)
+    employee = config.employees[0]
+    assert employee.name == "Ann & <Bo>"
+    assert employee.max_hours_per_week == 10
+    assert employee.cost_per_hour == 12.5
+
+
+def test_write_workbook_compression_level_round_trips(tmp_path):
+    rows = [["id", "name", "skills", "max_hours_per_week"], ["a", "A", "front", 10]]
+    fast = tmp_path / "fast.xlsx"
+    small = tmp_path / "small.xlsx"
+    write_workbook(fast, employees_rows=rows * 200, shifts_rows=None)
+    write_workbook(small, employees_rows=rows * 200, shifts_rows=None, compresslevel=9)
+
+    assert fast.read_bytes() != small.read_bytes()
+    with zipfile.ZipFile(fast) as a, zipfile.ZipFile(small) as b:
+        assert a.read("xl/worksheets/sheet1.xml") == b.read("xl/worksheets/sheet1.xml")
+
+
+def test_write_workbook_can_store_parts_uncompressed(tmp_path):
+    stored = tmp_path / "stored.xlsx"
+    rows = [["id", "name", "skills", "max_hours_per_week"], ["a", "A", "front", 10]]
+    write_workbook(stored, employees_rows=rows, compression=zipfile.ZIP_STORED)
+
+    with zipfile.ZipFile(stored) as archive:
+        assert {info.compress_type for info in archive.infolist()} == {zipfile.ZIP_STORED}
+
+
+@pytest.mark.parametrize("shared_strings", [True, False])
+def test_write_workbook_string_storage(tmp_path, shared_strings):
+    path = tmp_path / "strings.xlsx"
+    rows = [
+        ["id", "name", "skills", "max_hours_per_week"],
+        ["a", "A", "front", 10],
+        ["b", "B", "front", 8],
+    ]
+    write_workbook(path, employees_rows=rows, shifts_rows=None, shared_strings=shared_strings)
+
+    with zipfile.ZipFile(path) as archive:
+        assert ("xl/sharedStrings.xml" in archive.namelist()) is shared_strings
+        sheet = archive.read("xl/worksheets/sheet1.xml").decode("utf-8")
+    assert sheet.count('t="s"' if shared_strings else 't="inlineStr"') == 10